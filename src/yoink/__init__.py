@@ -4,19 +4,51 @@ YOINK - The public data crawler.
 Because it's public.
 """
 
-from yoink.crawler import Crawler
-from yoink.models import Page, CrawlConfig
-from yoink.checkpoint import CheckpointManager
-from yoink.storage import CheckpointStorage, LocalFileStorage, S3Storage, StorageFactory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from yoink.crawler import Crawler
+    from yoink.models import Page, CrawlConfig, ConnectionConfig
+    from yoink.checkpoint import CheckpointManager
+    from yoink.storage import CheckpointStorage, LocalFileStorage, S3Storage, StorageFactory
 
 __version__ = "0.1.0"
 __all__ = [
     "Crawler",
     "Page",
     "CrawlConfig",
+    "ConnectionConfig",
     "CheckpointManager",
     "CheckpointStorage",
     "LocalFileStorage",
     "S3Storage",
     "StorageFactory",
 ]
+
+# Public names are imported on first access so that `import yoink` (and the
+# CLI's cheap subcommands) don't pay for aiohttp/trafilatura/pydantic up front
+_LAZY_IMPORTS = {
+    "Crawler": "yoink.crawler",
+    "Page": "yoink.models",
+    "CrawlConfig": "yoink.models",
+    "ConnectionConfig": "yoink.models",
+    "CheckpointManager": "yoink.checkpoint",
+    "CheckpointStorage": "yoink.storage",
+    "LocalFileStorage": "yoink.storage",
+    "S3Storage": "yoink.storage",
+    "StorageFactory": "yoink.storage",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'yoink' has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
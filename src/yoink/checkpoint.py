@@ -1,24 +1,87 @@
 """Checkpoint management for resumable crawls."""
 
+import asyncio
 import json
-from datetime import datetime
-from typing import Optional
-from pathlib import Path
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Collection, Optional
 import structlog
 
+from yoink import serialization
 from yoink.models import Page, CrawlConfig
-from yoink.storage import CheckpointStorage, StorageFactory
+
+if TYPE_CHECKING:
+    from yoink.storage import CheckpointStorage
 
 logger = structlog.get_logger()
 
+# Flush buffered page records once they exceed this many bytes, regardless of page count
+MAX_BUFFER_BYTES = 1024 * 1024
+
+# Number of checkpoint lines decoded per worker-thread batch during load
+LOAD_BATCH_SIZE = 1000
+
+# Pre-encoded record type tags, spliced in front of each record's own fields
+PAGE_RECORD_PREFIX = b'{"type":"page",'
+METADATA_RECORD_PREFIX = b'{"type":"metadata",'
+STATE_RECORD_PREFIX = b'{"type":"state",'
+STATE_DELTA_RECORD_PREFIX = b'{"type":"state_delta",'
+_PAGE_RECORD_PREFIX_TEXT = PAGE_RECORD_PREFIX.decode("utf-8")
+
+
+def _append_record(buffer: bytearray, prefix: bytes, payload: dict[str, Any]) -> None:
+    """Append a JSONL record: the type tag followed by the payload's fields."""
+    buffer += prefix
+    buffer += memoryview(serialization.dumps(payload))[1:]
+    buffer += b"\n"
+
+
+def _decode_lines(lines: list[str], skip_pages: bool = False) -> list[dict[str, Any]]:
+    """
+    Decode a batch of checkpoint lines, skipping blank or corrupt ones.
+
+    Well-formed batches are decoded in one comprehension; the per-line error
+    handling only runs if that fails. With ``skip_pages``, page records are
+    dropped by prefix before any JSON is parsed.
+    """
+    if skip_pages:
+        lines = [line for line in lines if not line.startswith(_PAGE_RECORD_PREFIX_TEXT)]
+
+    loads = serialization.loads
+    try:
+        records = [loads(line) for line in lines if line and not line.isspace()]
+    except json.JSONDecodeError:
+        records = _decode_lines_checked(lines)
+
+    # Valid JSON that isn't an object is rare; only pay for the filter then
+    if not all(type(data) is dict for data in records):
+        logger.error("checkpoint_parse_error", error="record is not an object")
+        records = [data for data in records if isinstance(data, dict)]
+    return records
+
+
+def _decode_lines_checked(lines: list[str]) -> list[Any]:
+    """Decode lines one at a time, logging and skipping corrupt ones."""
+    records = []
+    for line in lines:
+        if not line or line.isspace():
+            continue
+
+        try:
+            records.append(serialization.loads(line))
+        except json.JSONDecodeError as e:
+            logger.error("checkpoint_load_error", error=str(e), line=line[:100])
+    return records
+
 
 class CheckpointManager:
     """Manages checkpoint state for resumable crawls."""
 
     def __init__(
         self,
-        storage: CheckpointStorage,
+        storage: "CheckpointStorage",
         flush_interval: int = 10,
+        full_state_interval: int = 10,
+        state_interval: int = 100,
     ):
         """
         Initialize checkpoint manager.
@@ -26,26 +89,45 @@ class CheckpointManager:
         Args:
             storage: Storage backend for checkpoint
             flush_interval: Number of pages between flushes (default: 10)
+            full_state_interval: Number of state writes between full snapshots;
+                writes in between only record newly seen URLs (default: 10)
+            state_interval: Number of crawled pages between scheduler state
+                saves (default: 100)
         """
         self.storage = storage
         self.flush_interval = flush_interval
+        self.full_state_interval = full_state_interval
+        self.state_interval = state_interval
         self._page_count = 0
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._state_writes = 0
         logger.info("checkpoint_manager_init", flush_interval=flush_interval)
 
     @classmethod
-    def from_uri(cls, uri: str, flush_interval: int = 10) -> "CheckpointManager":
+    def from_uri(
+        cls,
+        uri: str,
+        flush_interval: int = 10,
+        full_state_interval: int = 10,
+        state_interval: int = 100,
+    ) -> "CheckpointManager":
         """
         Create checkpoint manager from URI.
 
         Args:
             uri: Storage URI (file path, s3://, etc.)
             flush_interval: Number of pages between flushes
+            full_state_interval: Number of state writes between full snapshots
+            state_interval: Number of crawled pages between state saves
 
         Returns:
             CheckpointManager instance
         """
+        from yoink.storage import StorageFactory
+
         storage = StorageFactory.from_uri(uri)
-        return cls(storage, flush_interval)
+        return cls(storage, flush_interval, full_state_interval, state_interval)
 
     async def write_metadata(self, start_url: str, config: CrawlConfig) -> None:
         """
@@ -56,13 +138,15 @@ class CheckpointManager:
             config: Crawl configuration
         """
         metadata = {
-            "type": "metadata",
             "start_url": start_url,
             "config": config.model_dump(),
-            "started_at": datetime.utcnow().isoformat(),
+            "started_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
         }
 
-        await self.storage.write(json.dumps(metadata) + "\n")
+        # Buffered pages go out in the same write so a single flush persists both
+        data = self._take_pending()
+        _append_record(data, METADATA_RECORD_PREFIX, metadata)
+        await self.storage.write(data)
         await self.storage.flush()
         logger.info("checkpoint_metadata_written", start_url=start_url)
 
@@ -70,45 +154,97 @@ class CheckpointManager:
         """
         Write page to checkpoint.
 
+        Pages are buffered in memory and handed to storage as a single batch
+        every ``flush_interval`` pages (or once the buffer exceeds
+        ``MAX_BUFFER_BYTES``).
+
         Args:
             page: Page to write
         """
-        page_data = {
-            "type": "page",
-            **page.model_dump(mode="json"),
-        }
-
-        await self.storage.write(json.dumps(page_data) + "\n")
+        # Serialize straight to JSON (no intermediate dict) and splice the
+        # type tag in front of the page's own fields
+        payload = page.__pydantic_serializer__.to_json(page)
+        self._pending += PAGE_RECORD_PREFIX
+        self._pending += memoryview(payload)[1:]
+        self._pending += b"\n"
+        self._pending_count += 1
         self._page_count += 1
 
-        # Flush periodically
-        if self._page_count % self.flush_interval == 0:
-            await self.storage.flush()
+        if self._pending_count >= self.flush_interval or len(self._pending) >= MAX_BUFFER_BYTES:
+            await self._drain()
             logger.info("checkpoint_flushed", pages=self._page_count)
 
+    async def _drain(self) -> None:
+        """Write buffered page records to storage as one batch and flush."""
+        if not self._pending:
+            return
+
+        await self.storage.write(self._take_pending())
+        await self.storage.flush()
+
+    def _take_pending(self) -> bytearray:
+        """
+        Detach and return the buffered page records.
+
+        The buffer is swapped out synchronously so concurrent writers start a
+        fresh one instead of re-draining (or losing) lines that are mid-write.
+        """
+        data, self._pending = self._pending, bytearray()
+        self._pending_count = 0
+        return data
+
     async def write_state(
         self,
-        visited: set[str],
+        visited: Collection[str],
         queue: list[tuple[str, int]],
-        filtered: set[str],
+        filtered: Collection[str],
+        visited_added: Optional[list[str]] = None,
+        filtered_added: Optional[list[str]] = None,
     ) -> None:
         """
         Write scheduler state to checkpoint.
 
+        When the caller supplies the URLs added since its previous write
+        (``visited_added``/``filtered_added``), writes between full snapshots
+        are ``state_delta`` records holding only those URLs plus the current
+        queue. The first write, every ``full_state_interval``-th write, and any
+        write without deltas is a full snapshot. ``load`` folds deltas back
+        into full state.
+
         Args:
-            visited: Set of visited URLs
+            visited: Visited URLs (a list is written as-is, avoiding a copy)
             queue: Current URL queue with depths
-            filtered: Set of filtered URLs
-        """
-        state = {
-            "type": "state",
-            "visited": list(visited),
-            "queue": queue,
-            "filtered": list(filtered),
-            "saved_at": datetime.utcnow().isoformat(),
-        }
+            filtered: Filtered URLs (a list is written as-is, avoiding a copy)
+            visited_added: URLs added to visited since the previous write
+            filtered_added: URLs added to filtered since the previous write
+        """
+        full_snapshot = (
+            visited_added is None
+            or filtered_added is None
+            or self._state_writes % self.full_state_interval == 0
+        )
+        if full_snapshot:
+            prefix = STATE_RECORD_PREFIX
+            state = {
+                "visited": visited if isinstance(visited, list) else list(visited),
+                "queue": queue,
+                "filtered": filtered if isinstance(filtered, list) else list(filtered),
+                "saved_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+            }
+        else:
+            prefix = STATE_DELTA_RECORD_PREFIX
+            state = {
+                "visited_added": visited_added,
+                "queue": queue,
+                "filtered_added": filtered_added,
+                "saved_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+            }
 
-        await self.storage.write(json.dumps(state) + "\n")
+        self._state_writes += 1
+
+        data = self._take_pending()
+        _append_record(data, prefix, state)
+        await self.storage.write(data)
         await self.storage.flush()
         logger.info(
             "checkpoint_state_written",
@@ -117,9 +253,14 @@ class CheckpointManager:
             filtered=len(filtered),
         )
 
-    async def load(self) -> dict:
+    async def load(self, include_pages: bool = True) -> dict[str, Any]:
         """
-        Load checkpoint data.
+        Load checkpoint data in a single pass.
+
+        Args:
+            include_pages: Build Page objects. When False, page records are
+                skipped by prefix without being parsed and ``pages`` is empty,
+                which makes checking metadata/state cheap on large checkpoints.
 
         Returns:
             Dictionary with:
@@ -139,31 +280,21 @@ class CheckpointManager:
         pages = []
         state = None
 
-        async for line in self.storage.read():
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                data = json.loads(line)
-                data_type = data.get("type")
-
-                if data_type == "metadata":
-                    metadata = data
-                elif data_type == "page":
-                    # Remove 'type' field before creating Page
-                    page_data = {k: v for k, v in data.items() if k != "type"}
-                    pages.append(Page(**page_data))
-                elif data_type == "state":
-                    # Keep latest state (overwrite previous)
-                    state = data
-
-            except json.JSONDecodeError as e:
-                logger.error("checkpoint_load_error", error=str(e), line=line[:100])
-                continue
-            except Exception as e:
-                logger.error("checkpoint_parse_error", error=str(e))
-                continue
+        async for data in self._iter_records(skip_pages=not include_pages):
+            data_type = data.get("type")
+
+            if data_type == "page":
+                if include_pages:
+                    page = self._to_page(data)
+                    if page is not None:
+                        pages.append(page)
+            elif data_type == "metadata":
+                metadata = data
+            elif data_type == "state":
+                # Keep latest state (overwrite previous)
+                state = data
+            elif data_type == "state_delta":
+                state = self._apply_state_delta(state, data)
 
         logger.info(
             "checkpoint_loaded",
@@ -178,8 +309,102 @@ class CheckpointManager:
             "state": state,
         }
 
+    async def load_metadata_and_state(self) -> dict[str, Any]:
+        """
+        Load crawl metadata and the latest scheduler state without building pages.
+
+        Returns:
+            Dictionary with:
+                - metadata: Crawl metadata
+                - state: Latest scheduler state
+        """
+        data = await self.load(include_pages=False)
+        return {"metadata": data["metadata"], "state": data["state"]}
+
+    async def iter_pages(self) -> AsyncIterator[Page]:
+        """
+        Stream pages from checkpoint one at a time, for consumers that do not
+        need to hold every page in memory.
+
+        Yields:
+            Pages in the order they were written
+        """
+        if not await self.storage.exists():
+            return
+
+        async for data in self._iter_records():
+            if data.get("type") == "page":
+                page = self._to_page(data)
+                if page is not None:
+                    yield page
+
+    async def _iter_records(self, skip_pages: bool = False) -> AsyncIterator[dict[str, Any]]:
+        """
+        Read and decode checkpoint records, skipping blank or corrupt lines.
+
+        Lines are decoded in batches on a worker thread while the next batch is
+        being read from storage. JSON decoding holds the GIL, so this overlaps
+        decoding with storage I/O rather than decoding in parallel. Record
+        order is preserved.
+        """
+        batch: list[str] = []
+        pending: Optional[asyncio.Future[list[dict[str, Any]]]] = None
+
+        try:
+            async for line in self.storage.read():
+                batch.append(line)
+                if len(batch) >= LOAD_BATCH_SIZE:
+                    if pending is not None:
+                        for record in await pending:
+                            yield record
+                    pending = asyncio.ensure_future(
+                        asyncio.to_thread(_decode_lines, batch, skip_pages)
+                    )
+                    batch = []
+
+            if pending is not None:
+                records = await pending
+                pending = None
+                for record in records:
+                    yield record
+
+            for record in _decode_lines(batch, skip_pages):
+                yield record
+        finally:
+            # Consumer stopped early: don't leave the in-flight batch unawaited
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    @staticmethod
+    def _apply_state_delta(
+        state: Optional[dict[str, Any]], delta: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """Fold a state_delta record into the latest full state."""
+        if state is None:
+            logger.warning("checkpoint_state_delta_without_snapshot")
+            return None
+
+        state["visited"].extend(delta.get("visited_added", []))
+        state["filtered"].extend(delta.get("filtered_added", []))
+        state["queue"] = delta.get("queue", [])
+        state["saved_at"] = delta.get("saved_at")
+        return state
+
+    @staticmethod
+    def _to_page(data: dict[str, Any]) -> Optional[Page]:
+        """Build a Page from a checkpoint page record."""
+        try:
+            # Remove 'type' field before creating Page
+            page_data = {k: v for k, v in data.items() if k != "type"}
+            return Page(**page_data)
+        except Exception as e:
+            logger.error("checkpoint_parse_error", error=str(e))
+            return None
+
     async def close(self) -> None:
         """Close checkpoint and ensure all data is persisted."""
+        if self._pending:
+            await self.storage.write(self._take_pending())
         await self.storage.flush()
         await self.storage.close()
         logger.info("checkpoint_closed", total_pages=self._page_count)
@@ -1,26 +1,30 @@
 """CLI interface for yoink."""
 
-import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 import click
-import structlog
-
-from yoink.crawler import Crawler
-from yoink.models import CrawlConfig
-from yoink.writers import Writer
-from yoink.stats import CrawlStats
-from yoink.filters import CombinedFilter
-from yoink.checkpoint import CheckpointManager
+
 from yoink import __version__
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.dev.ConsoleRenderer(),
-    ]
-)
+# Crawl/stats machinery (aiohttp, trafilatura, pydantic, ...) is imported inside
+# the commands that need it, so `yoink version` and `--help` start quickly
+if TYPE_CHECKING:
+    from yoink.crawler import Crawler
+    from yoink.models import Page
+    from yoink.checkpoint import CheckpointManager
+
+
+def _configure_logging() -> None:
+    """Configure structured logging for commands that do real work."""
+    import structlog
+
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.dev.ConsoleRenderer(),
+        ]
+    )
 
 
 @click.group()
@@ -115,6 +119,11 @@ def main():
     is_flag=True,
     help="Resume from checkpoint file",
 )
+@click.option(
+    "--no-uvloop",
+    is_flag=True,
+    help="Use the default asyncio event loop even if uvloop is installed",
+)
 def crawl(
     url: str,
     depth: int,
@@ -131,6 +140,7 @@ def crawl(
     checkpoint: str,
     checkpoint_interval: int,
     resume: bool,
+    no_uvloop: bool,
 ):
     """
     Yoink a website starting from URL.
@@ -147,6 +157,16 @@ def crawl(
 
         yoink crawl https://example.com --skip-extensions pdf,zip,exe
     """
+    import asyncio
+
+    from yoink.crawler import Crawler
+    from yoink.models import CrawlConfig
+    from yoink.writers import Writer
+    from yoink.filters import CombinedFilter
+    from yoink.checkpoint import CheckpointManager
+
+    _configure_logging()
+
     # Validate checkpoint/resume options
     if resume and not checkpoint:
         click.echo("Error: --resume requires --checkpoint to be specified", err=True)
@@ -201,20 +221,21 @@ def crawl(
     # Create crawler
     crawler = Crawler(config=config, url_filter=url_filter, checkpoint_manager=checkpoint_manager)
 
-    # Run crawl
-    try:
-        pages = asyncio.run(crawler.crawl_with_progress(url, resume=resume))
-    except KeyboardInterrupt:
-        click.echo("\nCrawl interrupted by user")
-        pages = crawler.pages
-        # Save checkpoint on interruption
-        if checkpoint_manager:
-            click.echo("Saving checkpoint before exit...")
-            asyncio.run(crawler._save_checkpoint_state())
-            asyncio.run(checkpoint_manager.close())
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        return
+    # Run crawl on a single event loop so the checkpoint save after an
+    # interrupt doesn't have to spin up (and tear down) fresh loops
+    with asyncio.Runner(loop_factory=_event_loop_factory(use_uvloop=not no_uvloop)) as runner:
+        try:
+            pages = runner.run(crawler.crawl_with_progress(url, resume=resume))
+        except KeyboardInterrupt:
+            click.echo("\nCrawl interrupted by user")
+            pages = crawler.pages
+            # Save checkpoint on interruption
+            if checkpoint_manager:
+                click.echo("Saving checkpoint before exit...")
+                runner.run(_save_and_close_checkpoint(crawler, checkpoint_manager))
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+            return
 
     if not pages:
         click.echo("No pages were crawled")
@@ -224,12 +245,7 @@ def crawl(
     # If using checkpoint, don't create separate output file unless explicitly specified
     if checkpoint and not output:
         click.echo(f"Yoinked {len(pages)} pages (saved in checkpoint: {checkpoint})")
-
-        # Print some stats
-        total_links = sum(len(p.links) for p in pages)
-        total_text_size = sum(len(p.text or "") for p in pages)
-        click.echo(f"Total links found: {total_links}")
-        click.echo(f"Total text extracted: {total_text_size:,} characters")
+        _echo_totals(pages)
         return
 
     if output is None:
@@ -248,17 +264,46 @@ def crawl(
             Writer.write_text(pages, output_path)
 
         click.echo(f"Yoinked {len(pages)} pages to {output_path}")
-
-        # Print some stats
-        total_links = sum(len(p.links) for p in pages)
-        total_text_size = sum(len(p.text or "") for p in pages)
-        click.echo(f"Total links found: {total_links}")
-        click.echo(f"Total text extracted: {total_text_size:,} characters")
+        _echo_totals(pages)
 
     except Exception as e:
         click.echo(f"Error writing output: {e}", err=True)
 
 
+def _event_loop_factory(use_uvloop: bool = True):
+    """Return uvloop's loop factory when installed and enabled, else None (default loop)."""
+    if not use_uvloop:
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+def _echo_totals(pages: "list[Page]") -> None:
+    """Print total links and extracted text size in a single pass over pages."""
+    total_links = 0
+    total_text_size = 0
+    for p in pages:
+        total_links += len(p.links)
+        if p.text:
+            total_text_size += len(p.text)
+
+    click.echo(f"Total links found: {total_links}")
+    click.echo(f"Total text extracted: {total_text_size:,} characters")
+
+
+async def _save_and_close_checkpoint(
+    crawler: "Crawler", checkpoint_manager: "CheckpointManager"
+) -> None:
+    """Persist scheduler state and close the checkpoint after an interrupted crawl."""
+    await crawler._save_checkpoint_state()
+    await checkpoint_manager.close()
+
+
 @main.command()
 @click.argument("file_path", type=click.Path(exists=True))
 @click.option(
@@ -285,16 +330,19 @@ def stats(file_path: str, export: str, output_json: bool):
 
         yoink stats crawl_output.jsonl --json
     """
+    from yoink import serialization
+    from yoink.stats import CrawlStats
+
+    _configure_logging()
+
     try:
         path = Path(file_path)
-        crawl_stats = CrawlStats.from_file(path)
+        crawl_stats = CrawlStats.from_file_streaming(path)
 
         if output_json:
-            # Output as JSON
-            import json
-
+            # Output as JSON (bytes go straight to the binary stdout stream)
             stats_data = crawl_stats.compute()
-            click.echo(json.dumps(stats_data, indent=2))
+            click.echo(serialization.dumps(stats_data, indent=True))
         else:
             # Output human-readable summary
             summary = crawl_stats.format_summary()
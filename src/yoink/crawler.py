@@ -1,7 +1,9 @@
 """Core crawler engine."""
 
 import asyncio
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
 from tqdm.asyncio import tqdm
 import structlog
 
@@ -15,6 +17,36 @@ from yoink.checkpoint import CheckpointManager
 
 logger = structlog.get_logger()
 
+# Pages between progress bar postfix (depth/queue size) refreshes
+PROGRESS_POSTFIX_INTERVAL = 16
+
+
+def _parse_page(
+    parser: Parser,
+    extractor: Extractor,
+    html: str,
+    url: str,
+    extract_text: bool,
+) -> tuple[dict, Optional[str]]:
+    """
+    Parse links/metadata and optionally extract text from a page.
+
+    Module-level so it can be sent to a process pool.
+
+    Args:
+        parser: Parser to extract title, links and metadata with
+        extractor: Extractor to pull clean text with
+        html: Raw HTML content
+        url: Page URL
+        extract_text: Whether to run text extraction
+
+    Returns:
+        Tuple of (parsed title/links/metadata dict, extracted text or None)
+    """
+    parsed = parser.parse(html, url)
+    text = extractor.extract(html, url) if extract_text else None
+    return parsed, text
+
 
 class Crawler:
     """Main async web crawler."""
@@ -40,9 +72,11 @@ class Crawler:
             max_depth=self.config.max_depth,
             follow_external=self.config.follow_external,
             url_filter=url_filter,
+            track_changes=checkpoint_manager is not None,
         )
         self.pages: list[Page] = []
         self.checkpoint_manager = checkpoint_manager
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
 
     async def crawl(self, start_url: str, resume: bool = False) -> list[Page]:
         """
@@ -75,18 +109,21 @@ class Crawler:
             await self.scheduler.add(start_url, depth=0)
 
         # Create fetcher context
-        async with Fetcher(
-            user_agent=self.config.user_agent,
-            timeout=self.config.timeout,
-        ) as fetcher:
-            # Create worker tasks
-            workers = [
-                asyncio.create_task(self._worker(fetcher, worker_id))
-                for worker_id in range(self.config.max_concurrency)
-            ]
-
-            # Wait for all workers to complete
-            await asyncio.gather(*workers)
+        with self._parse_processes():
+            async with Fetcher(
+                user_agent=self.config.user_agent,
+                timeout=self.config.timeout,
+                connection=self.config.connection,
+                max_body_bytes=self.config.max_body_bytes,
+            ) as fetcher:
+                # Create worker tasks
+                workers = [
+                    asyncio.create_task(self._worker(fetcher, worker_id))
+                    for worker_id in range(self.config.max_concurrency)
+                ]
+
+                # Wait for all workers to complete
+                await asyncio.gather(*workers)
 
         # Save final state if checkpointing
         if self.checkpoint_manager:
@@ -114,14 +151,11 @@ class Crawler:
             if len(self.pages) >= self.config.max_pages:
                 break
 
-            # Get next URL from queue
-            item = await self.scheduler.get()
+            # Get next URL from queue, waiting while other workers may still
+            # discover links; None means the crawl is finished
+            item = await self.scheduler.next_url()
             if item is None:
-                # Queue is empty, check if other workers are still working
-                await asyncio.sleep(0.1)
-                if self.scheduler.is_empty() and len(self.pages) > 0:
-                    break
-                continue
+                break
 
             url, depth = item
 
@@ -129,13 +163,8 @@ class Crawler:
                 # Fetch page
                 html, status_code = await fetcher.fetch(url)
 
-                # Parse HTML
-                parsed = self.parser.parse(html, url)
-
-                # Extract text content if configured
-                text = None
-                if self.config.extract_text:
-                    text = self.extractor.extract(html, url)
+                # Parse HTML and extract text content if configured
+                parsed, text = await self._parse(html, url)
 
                 # Create page object
                 page = Page(
@@ -153,7 +182,7 @@ class Crawler:
 
                 # Write to checkpoint if enabled
                 if self.checkpoint_manager:
-                    await self.checkpoint_manager.write_page(page)
+                    await self._checkpoint_page(page)
 
                 logger.info(
                     "page_crawled",
@@ -165,8 +194,7 @@ class Crawler:
                 )
 
                 # Add discovered links to queue
-                for link in parsed["links"]:
-                    await self.scheduler.add(link, depth=depth + 1)
+                await self.scheduler.add_many(parsed["links"], depth=depth + 1)
 
             except Exception as e:
                 logger.error(
@@ -176,6 +204,9 @@ class Crawler:
                     worker=worker_id,
                 )
 
+            finally:
+                self.scheduler.task_done()
+
     async def crawl_with_progress(self, start_url: str, resume: bool = False) -> list[Page]:
         """
         Crawl with progress bar (for CLI use).
@@ -199,21 +230,24 @@ class Crawler:
 
             await self.scheduler.add(start_url, depth=0)
 
-        async with Fetcher(
-            user_agent=self.config.user_agent,
-            timeout=self.config.timeout,
-        ) as fetcher:
-            with tqdm(
-                total=self.config.max_pages,
-                desc="Yoinking pages",
-                unit="page",
-            ) as pbar:
-                workers = [
-                    asyncio.create_task(self._worker_with_progress(fetcher, worker_id, pbar))
-                    for worker_id in range(self.config.max_concurrency)
-                ]
-
-                await asyncio.gather(*workers)
+        with self._parse_processes():
+            async with Fetcher(
+                user_agent=self.config.user_agent,
+                timeout=self.config.timeout,
+                connection=self.config.connection,
+                max_body_bytes=self.config.max_body_bytes,
+            ) as fetcher:
+                with tqdm(
+                    total=self.config.max_pages,
+                    desc="Yoinking pages",
+                    unit="page",
+                ) as pbar:
+                    workers = [
+                        asyncio.create_task(self._worker_with_progress(fetcher, worker_id, pbar))
+                        for worker_id in range(self.config.max_concurrency)
+                    ]
+
+                    await asyncio.gather(*workers)
 
         # Save final state if checkpointing
         if self.checkpoint_manager:
@@ -229,22 +263,15 @@ class Crawler:
             if len(self.pages) >= self.config.max_pages:
                 break
 
-            item = await self.scheduler.get()
+            item = await self.scheduler.next_url()
             if item is None:
-                await asyncio.sleep(0.1)
-                if self.scheduler.is_empty() and len(self.pages) > 0:
-                    break
-                continue
+                break
 
             url, depth = item
 
             try:
                 html, status_code = await fetcher.fetch(url)
-                parsed = self.parser.parse(html, url)
-
-                text = None
-                if self.config.extract_text:
-                    text = self.extractor.extract(html, url)
+                parsed, text = await self._parse(html, url)
 
                 page = Page(
                     url=url,
@@ -261,17 +288,56 @@ class Crawler:
 
                 # Write to checkpoint if enabled
                 if self.checkpoint_manager:
-                    await self.checkpoint_manager.write_page(page)
+                    await self._checkpoint_page(page)
 
                 pbar.update(1)
-                pbar.set_postfix({"depth": depth, "queue": await self.scheduler.size()})
+                if len(self.pages) % PROGRESS_POSTFIX_INTERVAL == 0:
+                    # Shown on the bar's next redraw; the queue size is read
+                    # directly since an approximate value is fine for display
+                    pbar.set_postfix(
+                        {"depth": depth, "queue": len(self.scheduler.queue)}, refresh=False
+                    )
 
-                for link in parsed["links"]:
-                    await self.scheduler.add(link, depth=depth + 1)
+                await self.scheduler.add_many(parsed["links"], depth=depth + 1)
 
             except Exception as e:
                 logger.error("crawl_error", url=url, error=str(e))
 
+            finally:
+                self.scheduler.task_done()
+
+    @contextmanager
+    def _parse_processes(self) -> Iterator[None]:
+        """Run a parse process pool for the duration of a crawl, if configured."""
+        if not self.config.parse_processes:
+            yield
+            return
+
+        self._parse_pool = ProcessPoolExecutor(max_workers=self.config.parse_processes)
+        try:
+            yield
+        finally:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+
+    async def _parse(self, html: str, url: str) -> tuple[dict, Optional[str]]:
+        """
+        Parse a fetched page, in the process pool when one is running.
+
+        Args:
+            html: Raw HTML content
+            url: Page URL
+
+        Returns:
+            Tuple of (parsed title/links/metadata dict, extracted text or None)
+        """
+        args = (self.parser, self.extractor, html, url, self.config.extract_text)
+        if self._parse_pool is None:
+            return _parse_page(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, _parse_page, *args)
+
     async def _resume_from_checkpoint(self, start_url: str) -> None:
         """
         Resume crawl from checkpoint.
@@ -299,28 +365,11 @@ class Crawler:
         # Restore scheduler state if available
         state = checkpoint_data.get("state")
         if state:
-            # Restore visited URLs
-            for url in state.get("visited", []):
-                self.scheduler.visited.add(url)
-
-            # Restore filtered URLs
-            for url in state.get("filtered", []):
-                self.scheduler.filtered.add(url)
-
-            # Restore queue
-            for url, depth in state.get("queue", []):
-                self.scheduler.queue.append((url, depth))
-
-            # Restore start domain
-            if self.scheduler.queue or self.scheduler.visited:
-                from urllib.parse import urlparse
-
-                first_url = (
-                    list(self.scheduler.visited)[0]
-                    if self.scheduler.visited
-                    else self.scheduler.queue[0][0]
-                )
-                self.scheduler.start_domain = urlparse(first_url).netloc
+            self.scheduler.restore(
+                visited=state.get("visited", []),
+                filtered=state.get("filtered", []),
+                queue=state.get("queue", []),
+            )
 
             logger.info(
                 "checkpoint_state_restored",
@@ -333,13 +382,23 @@ class Crawler:
             logger.warning("no_checkpoint_state_found")
             await self.scheduler.add(start_url, depth=0)
 
+    async def _checkpoint_page(self, page: Page) -> None:
+        """Write page to checkpoint, saving scheduler state every state_interval pages."""
+        await self.checkpoint_manager.write_page(page)
+
+        if len(self.pages) % self.checkpoint_manager.state_interval == 0:
+            await self._save_checkpoint_state()
+
     async def _save_checkpoint_state(self) -> None:
         """Save current scheduler state to checkpoint."""
         if not self.checkpoint_manager:
             return
 
+        visited_added, filtered_added = self.scheduler.take_changes()
         await self.checkpoint_manager.write_state(
-            visited=self.scheduler.visited,
+            visited=self.scheduler.visited_list,
             queue=list(self.scheduler.queue),
-            filtered=self.scheduler.filtered,
+            filtered=self.scheduler.filtered_list,
+            visited_added=visited_added,
+            filtered_added=filtered_added,
         )
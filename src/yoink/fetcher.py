@@ -5,8 +5,13 @@ from typing import Optional
 import aiohttp
 import structlog
 
+from yoink.models import ConnectionConfig
+
 logger = structlog.get_logger()
 
+# Response bodies are read in chunks of this size
+READ_CHUNK_SIZE = 64 * 1024
+
 
 class Fetcher:
     """Async HTTP client wrapper."""
@@ -16,17 +21,29 @@ class Fetcher:
         user_agent: str = "yoink/0.1.0",
         timeout: int = 30,
         max_retries: int = 3,
+        connection: Optional[ConnectionConfig] = None,
+        max_body_bytes: int = 5 * 1024 * 1024,
     ):
         self.user_agent = user_agent
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
+        self.connection = connection or ConnectionConfig()
+        self.max_body_bytes = max_body_bytes
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
         """Create session on context enter."""
+        # One pooled session serves every request so connections are reused
+        connector = aiohttp.TCPConnector(
+            limit=self.connection.pool_limit,
+            limit_per_host=self.connection.pool_limit_per_host,
+            ttl_dns_cache=self.connection.dns_cache_ttl,
+            keepalive_timeout=self.connection.keepalive_timeout,
+        )
         self._session = aiohttp.ClientSession(
             headers={"User-Agent": self.user_agent},
             timeout=self.timeout,
+            connector=connector,
         )
         return self
 
@@ -47,6 +64,7 @@ class Fetcher:
 
         Raises:
             aiohttp.ClientError: On request failure after retries
+            ValueError: If the response body is larger than max_body_bytes
         """
         if not self._session:
             raise RuntimeError("Fetcher must be used as async context manager")
@@ -54,7 +72,7 @@ class Fetcher:
         for attempt in range(self.max_retries):
             try:
                 async with self._session.get(url) as response:
-                    content = await response.text()
+                    content = await self._read_text(url, response)
                     logger.info(
                         "fetched_url",
                         url=url,
@@ -75,3 +93,40 @@ class Fetcher:
                 await asyncio.sleep(2**attempt)  # Exponential backoff
 
         raise RuntimeError("Unreachable code")
+
+    async def _read_text(self, url: str, response: aiohttp.ClientResponse) -> str:
+        """
+        Stream a response body and decode it once, enforcing max_body_bytes.
+
+        Args:
+            url: Requested URL (for error messages)
+            response: Response whose body to read
+
+        Returns:
+            Decoded body text
+
+        Raises:
+            ValueError: If the body is larger than max_body_bytes
+        """
+        if response.content_length is not None and response.content_length > self.max_body_bytes:
+            raise ValueError(
+                f"Response body for {url} is {response.content_length} bytes, "
+                f"over the {self.max_body_bytes} byte limit"
+            )
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                raise ValueError(
+                    f"Response body for {url} is over the {self.max_body_bytes} byte limit"
+                )
+            chunks.append(chunk)
+
+        body = b"".join(chunks)
+        try:
+            return body.decode(response.charset or "utf-8", errors="replace")
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            return body.decode("utf-8", errors="replace")
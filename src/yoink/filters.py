@@ -2,10 +2,11 @@
 
 import re
 from typing import Optional
-from fnmatch import fnmatch
-from urllib.parse import urlparse
+import fnmatch
 import structlog
 
+from yoink.urls import netloc
+
 logger = structlog.get_logger()
 
 
@@ -30,6 +31,24 @@ class URLFilter:
         self.exclude_patterns = exclude_patterns or []
         self.skip_extensions = [ext.lower().lstrip('.') for ext in (skip_extensions or [])]
 
+        # Patterns are compiled once into combined regexes so each check is a
+        # single C-level scan instead of a Python loop over patterns
+        self._include_res = self._compile_patterns(self.include_patterns)
+        self._exclude_res = self._compile_patterns(self.exclude_patterns)
+        # Literal text each pattern requires, checked with str containment
+        # before running the regexes (None if any pattern has no literal)
+        self._include_literals = self._required_literals(self.include_patterns)
+        self._exclude_literals = self._required_literals(self.exclude_patterns)
+        self._extension_re = None
+        if self.skip_extensions:
+            # Match the extension at the end of the path only, never in the
+            # domain (e.g. a .zip TLD) or the query string
+            alternatives = '|'.join(re.escape(ext) for ext in self.skip_extensions)
+            self._extension_re = re.compile(
+                rf'\A(?>(?:[^:/?#]+://[^/?#]*)?)[^?#]*\.({alternatives})(?:;[^/?#]*)?(?:[?#]|\Z)',
+                re.IGNORECASE,
+            )
+
     def should_crawl(self, url: str) -> bool:
         """
         Check if URL should be crawled based on filters.
@@ -41,53 +60,138 @@ class URLFilter:
             True if URL should be crawled, False otherwise
         """
         # Check file extension first (fast check)
-        if self.skip_extensions:
-            parsed = urlparse(url)
-            path = parsed.path.lower()
-            for ext in self.skip_extensions:
-                if path.endswith(f'.{ext}'):
-                    logger.debug("url_filtered_extension", url=url, extension=ext)
-                    return False
+        if self._extension_re is not None:
+            match = self._extension_re.match(url)
+            if match:
+                logger.debug("url_filtered_extension", url=url, extension=match.group(1).lower())
+                return False
 
         # If include patterns exist, URL must match at least one
         if self.include_patterns:
-            if not any(self._match_pattern(url, pattern) for pattern in self.include_patterns):
+            if not self._matches(url, self._include_res, self._include_literals):
                 logger.debug("url_filtered_include", url=url)
                 return False
 
         # If exclude patterns exist, URL must not match any
         if self.exclude_patterns:
-            if any(self._match_pattern(url, pattern) for pattern in self.exclude_patterns):
+            if self._matches(url, self._exclude_res, self._exclude_literals):
                 logger.debug("url_filtered_exclude", url=url)
                 return False
 
         return True
 
-    def _match_pattern(self, url: str, pattern: str) -> bool:
+    @staticmethod
+    def _matches(
+        url: str,
+        patterns: list[re.Pattern[str]],
+        literals: Optional[tuple[str, ...]],
+    ) -> bool:
         """
-        Match URL against pattern (supports glob and regex).
+        Check if URL matches any of the compiled patterns.
 
         Args:
-            url: URL to match
-            pattern: Pattern to match against (glob or regex)
+            url: URL to check
+            patterns: Compiled patterns from _compile_patterns
+            literals: Literals required by the patterns, or None
 
         Returns:
-            True if pattern matches URL
+            True if any pattern matches
+        """
+        # A URL containing none of the required literals can't match, and
+        # str containment is far cheaper than a regex scan
+        if literals is not None and not any(literal in url for literal in literals):
+            return False
+        return any(pattern.match(url) for pattern in patterns)
+
+    @staticmethod
+    def _required_literals(patterns: list[str]) -> Optional[tuple[str, ...]]:
+        """
+        Find a literal substring that each pattern's matches must contain.
+
+        Substring patterns require themselves; globs require their longest
+        run of text between wildcards. Regexes and globs with character
+        classes aren't analyzed.
+
+        Args:
+            patterns: Glob, regex or substring patterns
+
+        Returns:
+            One literal per pattern, or None if some pattern has no literal
+        """
+        literals = []
+        for pattern in patterns:
+            # Classified the same way as in _pattern_to_regex
+            if '*' in pattern or '?' in pattern:
+                if '[' in pattern:
+                    return None
+                literal = max(re.split(r'[*?]', pattern), key=len)
+                if not literal:
+                    return None
+            elif pattern.startswith('^') or pattern.endswith('$') or '[' in pattern:
+                return None
+            else:
+                literal = pattern
+            literals.append(literal)
+        return tuple(literals)
+
+    @classmethod
+    def _compile_patterns(cls, patterns: list[str]) -> list[re.Pattern[str]]:
+        """
+        Compile patterns into as few regexes as possible.
+
+        Patterns without capture groups are joined into one alternation.
+        Regexes with groups are kept separate so their backreferences still
+        point at the right group.
+
+        Args:
+            patterns: Glob, regex or substring patterns
+
+        Returns:
+            List of compiled regexes; a URL matches if any of them match
+        """
+        joinable = []
+        compiled = []
+        for source in map(cls._pattern_to_regex, patterns):
+            if source is None:
+                continue
+            regex = re.compile(source)
+            if regex.groups:
+                compiled.append(regex)
+            else:
+                joinable.append(source)
+
+        if len(joinable) == 1:
+            compiled.insert(0, re.compile(joinable[0]))
+        elif joinable:
+            compiled.insert(0, re.compile('|'.join(f'(?:{source})' for source in joinable)))
+        return compiled
+
+    @staticmethod
+    def _pattern_to_regex(pattern: str) -> Optional[str]:
+        """
+        Translate a pattern (glob, regex or substring) into regex source.
+
+        Args:
+            pattern: Pattern to translate
+
+        Returns:
+            Regex source to match URLs against, or None if the pattern is invalid
         """
         # Try glob pattern first (simpler and more common)
         if '*' in pattern or '?' in pattern:
-            return fnmatch(url, pattern)
+            return fnmatch.translate(pattern)
 
         # Try regex if pattern looks like regex
         if pattern.startswith('^') or pattern.endswith('$') or '[' in pattern:
             try:
-                return bool(re.match(pattern, url))
+                re.compile(pattern)
             except re.error:
                 logger.warning("invalid_regex_pattern", pattern=pattern)
-                return False
+                return None
+            return pattern
 
         # Fall back to substring match
-        return pattern in url
+        return '(?s:.*?)' + re.escape(pattern)
 
     def get_stats(self) -> dict:
         """Get filter statistics."""
@@ -109,6 +213,8 @@ class DomainFilter:
             allowed_domains: List of allowed domains (e.g., ['example.com', 'test.com'])
         """
         self.allowed_domains = set(allowed_domains or [])
+        # Subdomain suffixes, checked in one str.endswith call
+        self._subdomain_suffixes = tuple(f'.{allowed}' for allowed in self.allowed_domains)
 
     def should_crawl(self, url: str) -> bool:
         """
@@ -123,17 +229,15 @@ class DomainFilter:
         if not self.allowed_domains:
             return True
 
-        parsed = urlparse(url)
-        domain = parsed.netloc
+        domain = netloc(url)
 
         # Check exact match
         if domain in self.allowed_domains:
             return True
 
         # Check subdomain match (e.g., sub.example.com matches example.com)
-        for allowed in self.allowed_domains:
-            if domain.endswith(f'.{allowed}'):
-                return True
+        if domain.endswith(self._subdomain_suffixes):
+            return True
 
         logger.debug("url_filtered_domain", url=url, domain=domain)
         return False
@@ -22,6 +22,19 @@ class Page(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class ConnectionConfig(BaseModel):
+    """Connection pool settings for the crawler's HTTP session."""
+
+    pool_limit: int = Field(default=0, ge=0, description="Max open connections (0 = unlimited)")
+    pool_limit_per_host: int = Field(
+        default=30, ge=0, description="Max open connections per host (0 = unlimited)"
+    )
+    dns_cache_ttl: int = Field(default=300, ge=0, description="DNS cache TTL in seconds")
+    keepalive_timeout: int = Field(
+        default=30, ge=0, description="Seconds to keep idle connections open for reuse"
+    )
+
+
 class CrawlConfig(BaseModel):
     """Configuration for crawler behavior."""
 
@@ -37,3 +50,14 @@ class CrawlConfig(BaseModel):
     follow_external: bool = Field(default=False, description="Follow links to external domains")
     extract_text: bool = Field(default=True, description="Extract clean text from pages")
     save_html: bool = Field(default=False, description="Save raw HTML")
+    max_body_bytes: int = Field(
+        default=5 * 1024 * 1024, ge=1, description="Skip pages with larger response bodies"
+    )
+    parse_processes: int = Field(
+        default=0,
+        ge=0,
+        description="Processes for HTML parsing/text extraction (0 = parse on the event loop)",
+    )
+    connection: ConnectionConfig = Field(
+        default_factory=ConnectionConfig, description="HTTP connection pool settings"
+    )
@@ -1,9 +1,12 @@
 """HTML parsing and URL extraction."""
 
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import sys
+from urllib.parse import urljoin
+from selectolax.lexbor import LexborHTMLParser
 import structlog
 
+from yoink.urls import netloc
+
 logger = structlog.get_logger()
 
 
@@ -21,63 +24,66 @@ class Parser:
         Returns:
             Dict with title, links, and metadata
         """
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
         # Extract title
         title = None
-        if soup.title:
-            title = soup.title.string.strip() if soup.title.string else None
+        title_node = tree.css_first("title")
+        if title_node is not None:
+            title = title_node.text(deep=False).strip() or None
 
         # Extract links
-        links = self._extract_links(soup, base_url)
+        links = self._extract_links(tree, base_url)
 
         # Extract metadata
-        metadata = self._extract_metadata(soup)
+        metadata = self._extract_metadata(tree)
 
         return {"title": title, "links": links, "metadata": metadata}
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def _extract_links(self, tree: LexborHTMLParser, base_url: str) -> list[str]:
         """Extract and normalize all links from page."""
         links = []
         seen = set()
 
-        for anchor in soup.find_all("a", href=True):
-            href = anchor["href"]
+        for anchor in tree.css("a[href]"):
+            href = anchor.attributes.get("href")
+            if href is None:
+                continue
 
             # Resolve relative URLs
             absolute_url = urljoin(base_url, href)
 
             # Remove fragments
-            absolute_url = absolute_url.split("#")[0]
+            fragment_start = absolute_url.find("#")
+            if fragment_start >= 0:
+                absolute_url = absolute_url[:fragment_start]
 
-            # Skip non-http(s) URLs
-            parsed = urlparse(absolute_url)
-            if parsed.scheme not in ("http", "https"):
+            # Skip non-http(s) URLs; urljoin keeps the scheme's original case
+            if not absolute_url[:8].lower().startswith(("http://", "https://")):
                 continue
 
-            # Deduplicate
+            # Deduplicate; interning makes every page that links to a URL
+            # (and the scheduler's visited set) share one string object
             if absolute_url not in seen:
                 seen.add(absolute_url)
-                links.append(absolute_url)
+                links.append(sys.intern(absolute_url))
 
         return links
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> dict[str, str]:
+    def _extract_metadata(self, tree: LexborHTMLParser) -> dict[str, str]:
         """Extract metadata from page (OpenGraph, meta tags, etc)."""
         metadata = {}
 
         # OpenGraph tags
-        for meta in soup.find_all("meta", property=True):
-            prop = meta.get("property", "")
-            if prop.startswith("og:"):
-                content = meta.get("content")
-                if content:
-                    metadata[prop] = content
+        for meta in tree.css('meta[property^="og:"]'):
+            content = meta.attributes.get("content")
+            if content:
+                metadata[meta.attributes["property"]] = content
 
         # Standard meta tags
-        for meta in soup.find_all("meta", attrs={"name": True}):
-            name = meta.get("name", "")
-            content = meta.get("content")
+        for meta in tree.css("meta[name]"):
+            name = meta.attributes.get("name") or ""
+            content = meta.attributes.get("content")
             if content and name in ("description", "author", "keywords", "date"):
                 metadata[name] = content
 
@@ -85,6 +91,4 @@ class Parser:
 
     def is_same_domain(self, url1: str, url2: str) -> bool:
         """Check if two URLs belong to the same domain."""
-        domain1 = urlparse(url1).netloc
-        domain2 = urlparse(url2).netloc
-        return domain1 == domain2
+        return netloc(url1) == netloc(url2)
@@ -2,23 +2,29 @@
 
 import asyncio
 from collections import deque
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Iterable, Optional
 import structlog
 
 from yoink.filters import CombinedFilter
+from yoink.urls import netloc
 
 logger = structlog.get_logger()
 
 
 class Scheduler:
-    """Manages URL queue with deduplication and depth tracking."""
+    """
+    Manages URL queue with deduplication and depth tracking.
+
+    All workers run on one event loop and no method awaits partway through
+    an update, so queue and visited-set changes are atomic without a lock.
+    """
 
     def __init__(
         self,
         max_depth: int = 1,
         follow_external: bool = False,
         url_filter: Optional[CombinedFilter] = None,
+        track_changes: bool = False,
     ):
         self.max_depth = max_depth
         self.follow_external = follow_external
@@ -27,7 +33,18 @@ class Scheduler:
         self.visited: set[str] = set()
         self.filtered: set[str] = set()  # Track filtered URLs
         self.start_domain: Optional[str] = None
-        self._lock = asyncio.Lock()
+        # URLs handed out by next_url() and not yet marked task_done(); the
+        # crawl is finished once this is zero and the queue is empty
+        self._in_progress = 0
+        self._changed = asyncio.Event()
+        # With track_changes, insertion-ordered copies of visited/filtered are
+        # kept so checkpoint state can be written without set->list conversion
+        # and the URLs added since the last save are a slice
+        self.track_changes = track_changes
+        self.visited_list: list[str] = []
+        self.filtered_list: list[str] = []
+        self._visited_mark = 0
+        self._filtered_mark = 0
 
     async def add(self, url: str, depth: int = 0):
         """
@@ -37,54 +54,149 @@ class Scheduler:
             url: URL to add
             depth: Current depth level
         """
-        async with self._lock:
-            # Set start domain from first URL
-            if self.start_domain is None:
-                self.start_domain = urlparse(url).netloc
+        self._add(url, depth)
 
-            # Skip if already visited
-            if url in self.visited:
-                return
+    async def add_many(self, urls: Iterable[str], depth: int = 0):
+        """
+        Add URLs discovered at the same depth in one call.
 
-            # Skip if exceeds max depth
-            if depth > self.max_depth:
+        Args:
+            urls: URLs to add
+            depth: Depth level shared by all URLs
+        """
+        # Links found on pages at the last level are all too deep
+        if depth > self.max_depth and self.start_domain is not None:
+            return
+
+        for url in urls:
+            self._add(url, depth)
+
+    def _add(self, url: str, depth: int):
+        """Queue a single URL unless it is a duplicate, too deep, or filtered."""
+        # Set start domain from first URL
+        if self.start_domain is None:
+            self.start_domain = netloc(url)
+
+        # Skip if already visited, or already rejected by the filters; the
+        # filters are deterministic, so a URL linked from many pages (login,
+        # share links) is only pattern-matched once
+        if url in self.visited or url in self.filtered:
+            return
+
+        # Skip if exceeds max depth
+        if depth > self.max_depth:
+            return
+
+        # Skip if external domain and not following external
+        if not self.follow_external:
+            if netloc(url) != self.start_domain:
                 return
 
-            # Skip if external domain and not following external
-            if not self.follow_external:
-                if urlparse(url).netloc != self.start_domain:
-                    return
-
-            # Apply URL filters
-            if self.url_filter and not self.url_filter.should_crawl(url):
-                self.filtered.add(url)
-                return
+        # Apply URL filters
+        if self.url_filter and not self.url_filter.should_crawl(url):
+            self.filtered.add(url)
+            if self.track_changes:
+                self.filtered_list.append(url)
+            return
 
-            self.visited.add(url)
-            self.queue.append((url, depth))
-            logger.debug("url_queued", url=url, depth=depth, queue_size=len(self.queue))
+        self.visited.add(url)
+        if self.track_changes:
+            self.visited_list.append(url)
+        self.queue.append((url, depth))
+        self._changed.set()
+        logger.debug("url_queued", url=url, depth=depth, queue_size=len(self.queue))
 
     async def get(self) -> Optional[tuple[str, int]]:
         """Get next URL from queue (FIFO)."""
-        async with self._lock:
+        if self.queue:
+            return self.queue.popleft()
+        return None
+
+    async def next_url(self) -> Optional[tuple[str, int]]:
+        """
+        Wait for the next URL to crawl.
+
+        Every URL returned must be followed by a call to ``task_done`` once
+        it has been processed (and its links added).
+
+        Returns:
+            Next (url, depth) pair, or None once the queue is empty and no
+            handed-out URL is still being processed
+        """
+        while True:
             if self.queue:
+                self._in_progress += 1
                 return self.queue.popleft()
-            return None
+            if self._in_progress == 0:
+                return None
+            self._changed.clear()
+            await self._changed.wait()
+
+    def task_done(self) -> None:
+        """Mark a URL returned by ``next_url`` as processed."""
+        self._in_progress -= 1
+        if self._in_progress == 0:
+            # Wake waiting workers so they can see the crawl is finished
+            self._changed.set()
 
     async def size(self) -> int:
         """Get current queue size."""
-        async with self._lock:
-            return len(self.queue)
+        return len(self.queue)
 
     async def visited_count(self) -> int:
         """Get count of visited URLs."""
-        async with self._lock:
-            return len(self.visited)
+        return len(self.visited)
 
     async def filtered_count(self) -> int:
         """Get count of filtered URLs."""
-        async with self._lock:
-            return len(self.filtered)
+        return len(self.filtered)
+
+    def take_changes(self) -> tuple[list[str], list[str]]:
+        """
+        Return and reset URLs added since the last call.
+
+        Only populated when the scheduler was created with ``track_changes``.
+
+        Returns:
+            Tuple of (newly visited URLs, newly filtered URLs)
+        """
+        visited_added = self.visited_list[self._visited_mark :]
+        filtered_added = self.filtered_list[self._filtered_mark :]
+        self._visited_mark = len(self.visited_list)
+        self._filtered_mark = len(self.filtered_list)
+        return visited_added, filtered_added
+
+    def restore(
+        self,
+        visited: list[str],
+        filtered: list[str],
+        queue: list[tuple[str, int]],
+    ) -> None:
+        """
+        Restore state saved by a previous crawl.
+
+        Restored URLs count as already saved, so they are not reported by
+        ``take_changes``.
+
+        Args:
+            visited: Visited URLs, in the order they were first seen
+            filtered: Filtered URLs
+            queue: Pending (url, depth) pairs
+        """
+        self.visited.update(visited)
+        self.filtered.update(filtered)
+        self.queue.extend((url, depth) for url, depth in queue)
+
+        if self.track_changes:
+            self.visited_list.extend(visited)
+            self.filtered_list.extend(filtered)
+            self._visited_mark = len(self.visited_list)
+            self._filtered_mark = len(self.filtered_list)
+
+        # First visited URL is the crawl's start URL
+        first_url = visited[0] if visited else queue[0][0] if queue else None
+        if first_url is not None:
+            self.start_domain = netloc(first_url)
 
     def is_empty(self) -> bool:
         """Check if queue is empty."""
@@ -0,0 +1,64 @@
+"""JSON encoding helpers with optional orjson acceleration."""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the stdlib encoder does not handle (matches orjson output)."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize object to UTF-8 encoded JSON.
+
+    Uses orjson when installed (pip install yoink[fast]) and falls back to the
+    standard library otherwise. Output is compact unless ``indent`` is set.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+    return text.encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,26 +1,33 @@
 """Statistics and analysis for crawled data."""
 
-import json
 from pathlib import Path
-from typing import Any
-from collections import Counter
-from urllib.parse import urlparse
+from typing import Any, Iterable, Iterator
+import heapq
+from operator import itemgetter
+from pydantic import TypeAdapter
 import structlog
 
 from yoink.models import Page
+from yoink.urls import netloc
 
 logger = structlog.get_logger()
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Validates a whole JSON array of pages in one pydantic-core call
+_PAGE_LIST_ADAPTER = TypeAdapter(list[Page])
+
 
 class CrawlStats:
     """Analyzes and computes statistics for crawled data."""
 
-    def __init__(self, pages: list[Page]):
+    def __init__(self, pages: Iterable[Page]):
         """
         Initialize stats analyzer.
 
         Args:
-            pages: List of crawled pages to analyze
+            pages: Crawled pages to analyze; a one-shot iterator is fine
+                since compute() reads them once and caches the result
         """
         self.pages = pages
         self._stats_cache: dict[str, Any] = {}
@@ -36,26 +43,59 @@ class CrawlStats:
         Returns:
             CrawlStats instance
         """
-        pages = []
+        pages = list(cls._iter_file(file_path))
+        logger.info("loaded_pages", path=str(file_path), count=len(pages))
+        return cls(pages)
+
+    @classmethod
+    def from_file_streaming(cls, file_path: Path) -> "CrawlStats":
+        """
+        Create stats that read pages from file lazily.
+
+        JSONL pages are parsed one line at a time while stats are computed,
+        so the full page list is never held in memory. The ``pages``
+        attribute is a one-shot iterator.
+
+        Args:
+            file_path: Path to JSONL or JSON file
+
+        Returns:
+            CrawlStats instance
+        """
+        # Resolve the format now so unsupported files fail here, not in compute()
+        if file_path.suffix.lower() not in (".jsonl", ".json"):
+            raise ValueError(f"Unsupported file format: {file_path.suffix.lower()}")
+        return cls(cls._iter_file(file_path))
+
+    @staticmethod
+    def _iter_file(file_path: Path) -> Iterator[Page]:
+        """
+        Yield pages from a JSONL or JSON file.
+
+        Args:
+            file_path: Path to JSONL or JSON file
+
+        Yields:
+            Parsed pages
+        """
         suffix = file_path.suffix.lower()
 
+        # Raw bytes go straight to pydantic-core's JSON parser, skipping
+        # text decoding and the intermediate dicts
         if suffix == ".jsonl":
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open(file_path, "rb") as f:
                 for line in f:
-                    data = json.loads(line.strip())
-                    pages.append(Page(**data))
+                    if not line.isspace():
+                        yield Page.model_validate_json(line)
 
         elif suffix == ".json":
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                pages = [Page(**item) for item in data]
+            # A JSON array can only be parsed whole
+            with open(file_path, "rb") as f:
+                yield from _PAGE_LIST_ADAPTER.validate_json(f.read())
 
         else:
             raise ValueError(f"Unsupported file format: {suffix}")
 
-        logger.info("loaded_pages", path=str(file_path), count=len(pages))
-        return cls(pages)
-
     def compute(self) -> dict[str, Any]:
         """
         Compute all statistics.
@@ -66,43 +106,69 @@ class CrawlStats:
         if self._stats_cache:
             return self._stats_cache
 
-        total_pages = len(self.pages)
+        # Aggregate every per-page statistic in a single pass
+        total_pages = 0
+        total_links = 0
+        total_text_size = 0
+        total_html_size = 0
+        max_depth = 0
+        pages_with_text = 0
+        pages_with_title = 0
+        pages_with_metadata = 0
+        pages_by_depth: dict[int, int] = {}
+        domain_counts: dict[str, int] = {}
+        status_codes: dict[int, int] = {}
+        text_lengths = []
+        text_lengths_append = text_lengths.append
+
+        for page in self.pages:
+            total_pages += 1
+            total_links += len(page.links)
+
+            text = page.text
+            if text:
+                text_length = len(text)
+                total_text_size += text_length
+                pages_with_text += 1
+                text_lengths_append(text_length)
+
+            if page.html:
+                total_html_size += len(page.html)
+            if page.title:
+                pages_with_title += 1
+            if page.metadata:
+                pages_with_metadata += 1
+
+            depth = page.depth
+            if depth > max_depth:
+                max_depth = depth
+            pages_by_depth[depth] = pages_by_depth.get(depth, 0) + 1
+
+            domain = netloc(page.url)
+            domain_counts[domain] = domain_counts.get(domain, 0) + 1
+            status_code = page.status_code
+            status_codes[status_code] = status_codes.get(status_code, 0) + 1
+
         if total_pages == 0:
             return {"total_pages": 0}
 
-        # Basic counts
-        total_links = sum(len(p.links) for p in self.pages)
-        total_text_size = sum(len(p.text or "") for p in self.pages)
-        total_html_size = sum(len(p.html or "") for p in self.pages)
-
         # Averages
         avg_links = total_links / total_pages
         avg_text_size = total_text_size / total_pages
         avg_html_size = total_html_size / total_pages if total_html_size > 0 else 0
 
-        # Depth analysis
-        depths = [p.depth for p in self.pages]
-        max_depth = max(depths) if depths else 0
-        pages_by_depth = Counter(depths)
-
         # Domain analysis
-        domains = [urlparse(p.url).netloc for p in self.pages]
-        unique_domains = len(set(domains))
-        top_domains = Counter(domains).most_common(10)
-
-        # Status codes
-        status_codes = Counter(p.status_code for p in self.pages)
-
-        # Pages with content
-        pages_with_text = sum(1 for p in self.pages if p.text)
-        pages_with_title = sum(1 for p in self.pages if p.title)
-        pages_with_metadata = sum(1 for p in self.pages if p.metadata)
-
-        # Content quality
-        text_lengths = [len(p.text or "") for p in self.pages if p.text]
-        min_text = min(text_lengths) if text_lengths else 0
-        max_text = max(text_lengths) if text_lengths else 0
-        median_text = sorted(text_lengths)[len(text_lengths) // 2] if text_lengths else 0
+        unique_domains = len(domain_counts)
+        top_domains = heapq.nlargest(10, domain_counts.items(), key=itemgetter(1))
+
+        # Content quality; the list is ours, so sort it in place (no copy) and
+        # read min, max and the (upper) median off the sorted order
+        min_text = max_text = median_text = 0
+        if text_lengths:
+            text_lengths.sort()
+            min_text = text_lengths[0]
+            max_text = text_lengths[-1]
+            median_text = text_lengths[len(text_lengths) // 2]
 
         self._stats_cache = {
             "total_pages": total_pages,
@@ -113,10 +179,10 @@ class CrawlStats:
             "avg_text_size": round(avg_text_size, 2),
             "avg_html_size": round(avg_html_size, 2),
             "max_depth": max_depth,
-            "pages_by_depth": dict(pages_by_depth),
+            "pages_by_depth": pages_by_depth,
             "unique_domains": unique_domains,
             "top_domains": [{"domain": d, "count": c} for d, c in top_domains],
-            "status_codes": dict(status_codes),
+            "status_codes": status_codes,
             "pages_with_text": pages_with_text,
             "pages_with_title": pages_with_title,
             "pages_with_metadata": pages_with_metadata,
@@ -201,11 +267,10 @@ class CrawlStats:
 
     def _format_bytes(self, size: float) -> str:
         """Format bytes as human-readable string."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} TB"
+        # Each unit is 2**10 of the previous one, so the unit index is the
+        # integer part's bit length / 10 (capped at TB)
+        unit = min(max(int(size).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+        return f"{size / (1 << (10 * unit)):.2f} {_BYTE_UNITS[unit]}"
 
     def export_csv(self, output_path: Path):
         """
@@ -1,24 +1,34 @@
 """Storage backends for checkpoint persistence."""
 
+import gzip
+import zlib
 import aiofiles
 from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import AsyncIterator, Optional
 import structlog
 
 logger = structlog.get_logger()
 
+# Every part of an S3 multipart upload except the last must be at least 5 MiB
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+# upload_part_copy copies at most 5 GiB per part
+S3_MAX_COPY_PART_SIZE = 5 * 1024 * 1024 * 1024
+# Chunk size for streaming S3 objects on read
+S3_READ_CHUNK_SIZE = 1024 * 1024
+
 
 class CheckpointStorage(ABC):
     """Abstract storage backend for checkpoints."""
 
     @abstractmethod
-    async def write(self, data: str) -> None:
+    async def write(self, data: bytes | bytearray) -> None:
         """
         Append data to checkpoint.
 
         Args:
-            data: String data to append (should include newline if needed)
+            data: UTF-8 encoded bytes to append (should include newline if needed)
         """
         pass
 
@@ -64,14 +74,14 @@ class LocalFileStorage(CheckpointStorage):
             path: Local file path
         """
         self.path = Path(path)
-        self._file_handle: Optional[aiofiles.threadpool.text.AsyncTextIOWrapper] = None
+        self._file_handle: Optional[aiofiles.threadpool.binary.AsyncBufferedIOBase] = None
         logger.info("local_storage_init", path=str(self.path))
 
-    async def write(self, data: str) -> None:
+    async def write(self, data: bytes | bytearray) -> None:
         """Append data to local file."""
         if self._file_handle is None:
-            # Open in append mode, create if doesn't exist
-            self._file_handle = await aiofiles.open(self.path, mode="a", encoding="utf-8")
+            # Open in binary append mode, create if doesn't exist
+            self._file_handle = await aiofiles.open(self.path, mode="ab")
 
         await self._file_handle.write(data)
         logger.debug("local_storage_write", bytes=len(data))
@@ -102,20 +112,28 @@ class LocalFileStorage(CheckpointStorage):
 
 
 class S3Storage(CheckpointStorage):
-    """AWS S3 storage backend."""
+    """
+    AWS S3 storage backend.
+
+    Keys ending in ``.gz`` are stored gzip-compressed: each flush appends one
+    gzip member, and the concatenated members decompress as a single stream.
+    """
 
-    def __init__(self, uri: str):
+    def __init__(self, uri: str, compress: Optional[bool] = None):
         """
         Initialize S3 storage.
 
         Args:
             uri: S3 URI in format s3://bucket/key/path
+            compress: Gzip-compress the object (default: True if key ends in .gz)
         """
         self.uri = uri
         self._parse_uri(uri)
-        self._buffer: list[str] = []
+        self.compress = self.key.endswith(".gz") if compress is None else compress
+        self._buffer: list[bytes | bytearray] = []
         self._client: Optional[any] = None
-        logger.info("s3_storage_init", bucket=self.bucket, key=self.key)
+        self._client_stack: Optional[AsyncExitStack] = None
+        logger.info("s3_storage_init", bucket=self.bucket, key=self.key, compress=self.compress)
 
     def _parse_uri(self, uri: str) -> None:
         """Parse S3 URI into bucket and key."""
@@ -134,7 +152,13 @@ class S3Storage(CheckpointStorage):
         self.key = parts[1]
 
     async def _get_client(self):
-        """Lazy load aioboto3 client."""
+        """
+        Lazy load aioboto3 client.
+
+        The client is entered once and reused for every operation, so its
+        connection pool (and TLS sessions) survive across reads and flushes
+        until close().
+        """
         if self._client is None:
             try:
                 import aioboto3
@@ -143,9 +167,11 @@ class S3Storage(CheckpointStorage):
                     "aioboto3 is required for S3 storage. Install with: pip install 'yoink[s3]' or pip install aioboto3"
                 )
 
+            stack = AsyncExitStack()
             try:
                 session = aioboto3.Session()
-                self._client = session.client("s3")
+                self._client = await stack.enter_async_context(session.client("s3"))
+                self._client_stack = stack
             except Exception as e:
                 raise RuntimeError(
                     f"Failed to create S3 client: {e}\n\n"
@@ -158,7 +184,7 @@ class S3Storage(CheckpointStorage):
 
         return self._client
 
-    async def write(self, data: str) -> None:
+    async def write(self, data: bytes | bytearray) -> None:
         """
         Buffer data for S3 upload.
 
@@ -172,84 +198,180 @@ class S3Storage(CheckpointStorage):
         if not await self.exists():
             return
 
-        client = await self._get_client()
+        s3 = await self._get_client()
 
-        async with client as s3:
-            try:
-                # Get object from S3
-                response = await s3.get_object(Bucket=self.bucket, Key=self.key)
+        try:
+            # Get object from S3
+            response = await s3.get_object(Bucket=self.bucket, Key=self.key)
 
-                # Read body line by line
-                async with response["Body"] as stream:
-                    # Read entire content and split by lines
-                    content = await stream.read()
-                    text = content.decode("utf-8")
+            # Stream the body, yielding lines as soon as they are complete;
+            # cutting only after a newline keeps lines and multi-byte
+            # characters whole across chunk boundaries
+            buffer = bytearray()
+            async with response["Body"] as stream:
+                async for chunk in self._iter_body(stream):
+                    buffer += chunk
+                    end = buffer.rfind(b"\n") + 1
+                    if end:
+                        for line in buffer[:end].decode("utf-8").splitlines(keepends=True):
+                            yield line
+                        del buffer[:end]
 
-                    for line in text.splitlines(keepends=True):
-                        yield line
+            if buffer:
+                for line in buffer.decode("utf-8").splitlines(keepends=True):
+                    yield line
 
-                logger.info("s3_storage_read", bucket=self.bucket, key=self.key)
+            logger.info("s3_storage_read", bucket=self.bucket, key=self.key)
 
-            except Exception as e:
-                logger.error("s3_storage_read_error", error=str(e))
-                raise
+        except Exception as e:
+            logger.error("s3_storage_read_error", error=str(e))
+            raise
+
+    async def _iter_body(self, stream) -> AsyncIterator[bytes]:
+        """
+        Yield the object's content in chunks, decompressing if needed.
+
+        Args:
+            stream: aiobotocore streaming body
+
+        Yields:
+            Chunks of (decompressed) object content
+        """
+        if not self.compress:
+            async for chunk in stream.iter_chunks(S3_READ_CHUNK_SIZE):
+                yield chunk
+            return
+
+        # Each flush appended its own gzip member; start a new decompressor
+        # whenever one member ends and feed it the leftover bytes
+        decompressor = zlib.decompressobj(wbits=31)
+        async for chunk in stream.iter_chunks(S3_READ_CHUNK_SIZE):
+            while chunk:
+                yield decompressor.decompress(chunk)
+                if not decompressor.eof:
+                    break
+                chunk = decompressor.unused_data
+                decompressor = zlib.decompressobj(wbits=31)
 
     async def exists(self) -> bool:
         """Check if S3 object exists."""
-        client = await self._get_client()
-
-        async with client as s3:
-            try:
-                await s3.head_object(Bucket=self.bucket, Key=self.key)
-                return True
-            except s3.exceptions.NoSuchKey:
-                return False
-            except Exception:
-                return False
+        s3 = await self._get_client()
+        return await self._object_size(s3) is not None
+
+    async def _object_size(self, s3) -> Optional[int]:
+        """Return the object's size in bytes, or None if it doesn't exist."""
+        try:
+            response = await s3.head_object(Bucket=self.bucket, Key=self.key)
+        except s3.exceptions.NoSuchKey:
+            return None
+        except Exception:
+            return None
+        return response["ContentLength"]
 
     async def flush(self) -> None:
         """Upload buffered data to S3."""
         if not self._buffer:
             return
 
-        client = await self._get_client()
-
-        async with client as s3:
-            try:
-                # Combine buffered data
-                data = "".join(self._buffer)
-
-                # Check if object exists to append or create
-                existing_data = ""
-                if await self.exists():
-                    # Download existing content
+        s3 = await self._get_client()
+
+        try:
+            # Combine buffered data
+            data = b"".join(self._buffer)
+            if self.compress:
+                # Level 1 is close to wire speed; JSONL text still shrinks several-fold
+                data = gzip.compress(data, compresslevel=1)
+
+            # Check if object exists to append or create
+            existing_size = await self._object_size(s3)
+            if existing_size is not None and existing_size >= S3_MIN_PART_SIZE:
+                # Large enough to be a multipart part: S3 copies the
+                # existing object server-side and appends the new data
+                await self._append_multipart(s3, data, existing_size)
+            else:
+                existing_data = b""
+                if existing_size is not None:
+                    # Download existing content (kept as raw bytes, so gzip
+                    # members are appended without recompressing)
                     response = await s3.get_object(Bucket=self.bucket, Key=self.key)
                     async with response["Body"] as stream:
-                        content = await stream.read()
-                        existing_data = content.decode("utf-8")
-
-                # Combine existing and new data
-                combined_data = existing_data + data
+                        existing_data = await stream.read()
 
                 # Upload combined data
-                await s3.put_object(
-                    Bucket=self.bucket, Key=self.key, Body=combined_data.encode("utf-8")
-                )
+                await s3.put_object(Bucket=self.bucket, Key=self.key, Body=existing_data + data)
 
-                logger.info(
-                    "s3_storage_flush",
-                    bucket=self.bucket,
-                    key=self.key,
-                    bytes=len(data),
-                    lines=len(self._buffer),
-                )
+            logger.info(
+                "s3_storage_flush",
+                bucket=self.bucket,
+                key=self.key,
+                bytes=len(data),
+                lines=len(self._buffer),
+            )
 
-                # Clear buffer
-                self._buffer.clear()
+            # Clear buffer
+            self._buffer.clear()
 
-            except Exception as e:
-                logger.error("s3_storage_flush_error", error=str(e))
-                raise
+        except Exception as e:
+            logger.error("s3_storage_flush_error", error=str(e))
+            raise
+
+    async def _append_multipart(self, s3, data: bytes, existing_size: int) -> None:
+        """
+        Append data to the object without downloading it.
+
+        The existing object becomes the leading part(s) of a multipart upload
+        via upload_part_copy and the new data is the final part, so each
+        flush transfers only the new bytes. The object stays complete and
+        readable after every flush.
+
+        Args:
+            s3: Entered S3 client
+            data: Bytes to append
+            existing_size: Current object size (at least S3_MIN_PART_SIZE)
+        """
+        upload = await s3.create_multipart_upload(Bucket=self.bucket, Key=self.key)
+        upload_id = upload["UploadId"]
+
+        try:
+            # Split the copy into equal ranges so none falls under the
+            # minimum part size or over the copy limit
+            copy_parts = -(-existing_size // S3_MAX_COPY_PART_SIZE)
+            range_size = -(-existing_size // copy_parts)
+            parts = []
+
+            for start in range(0, existing_size, range_size):
+                end = min(start + range_size, existing_size) - 1
+                part_number = len(parts) + 1
+                response = await s3.upload_part_copy(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    CopySource={"Bucket": self.bucket, "Key": self.key},
+                    CopySourceRange=f"bytes={start}-{end}",
+                )
+                parts.append({"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]})
+
+            part_number = len(parts) + 1
+            response = await s3.upload_part(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+            parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+            await s3.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+
+        except Exception:
+            await s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=upload_id)
+            raise
 
     async def close(self) -> None:
         """Flush remaining data and close S3 client."""
@@ -257,7 +379,10 @@ class S3Storage(CheckpointStorage):
         if self._buffer:
             await self.flush()
 
-        # aioboto3 session cleanup is handled by context manager
+        # Exit the client entered by _get_client, closing its connections
+        if self._client_stack is not None:
+            await self._client_stack.aclose()
+            self._client_stack = None
         self._client = None
 
 
@@ -278,6 +403,7 @@ class StorageFactory:
         Examples:
             - './checkpoint.jsonl' -> LocalFileStorage
             - 's3://bucket/checkpoint.jsonl' -> S3Storage
+            - 's3://bucket/checkpoint.jsonl.gz' -> S3Storage (gzip-compressed)
         """
         if uri.startswith("s3://"):
             return S3Storage(uri)
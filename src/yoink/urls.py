@@ -0,0 +1,26 @@
+"""Fast URL helpers for the crawl hot path."""
+
+import re
+from urllib.parse import urlparse
+
+# scheme://netloc; netloc ends at the first '/', '?' or '#' like urlparse's
+_NETLOC_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)")
+
+
+def netloc(url: str) -> str:
+    """
+    Return the network location of a URL, as ``urlparse(url).netloc`` would.
+
+    Absolute URLs are handled with a single regex match instead of building
+    a full ParseResult; anything else falls back to urlparse.
+
+    Args:
+        url: URL to inspect
+
+    Returns:
+        Network location (host and optional port/userinfo), or empty string
+    """
+    match = _NETLOC_RE.match(url)
+    if match is not None:
+        return match.group(1)
+    return urlparse(url).netloc
@@ -1,14 +1,24 @@
 """Output writers for different formats."""
 
-import json
 from pathlib import Path
 from typing import List
+from pydantic import TypeAdapter
 import structlog
 
+from yoink import serialization
 from yoink.models import Page
 
 logger = structlog.get_logger()
 
+# Serializes a whole page list in one pydantic-core call
+_PAGE_LIST_ADAPTER = TypeAdapter(list[Page])
+
+# Pages per Parquet row group; bounds the memory used while converting
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+# File buffer for JSONL output; pages are written in ~1 MiB system calls
+JSONL_WRITE_BUFFER_SIZE = 1024 * 1024
+
 
 class Writer:
     """Handles writing crawled data to different formats."""
@@ -22,10 +32,8 @@ class Writer:
             pages: List of crawled pages
             output_path: Output file path
         """
-        data = [page.model_dump(mode="json") for page in pages]
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_path, "wb") as f:
+            f.write(_PAGE_LIST_ADAPTER.dump_json(pages, indent=2))
 
         logger.info("wrote_json", path=str(output_path), pages=len(pages))
 
@@ -38,10 +46,13 @@ class Writer:
             pages: List of crawled pages
             output_path: Output file path
         """
-        with open(output_path, "w", encoding="utf-8") as f:
+        # pydantic-core serializes each page straight to UTF-8 bytes
+        to_json = Page.__pydantic_serializer__.to_json
+        with open(output_path, "wb", buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+            write = f.write
             for page in pages:
-                json_line = json.dumps(page.model_dump(mode="json"), ensure_ascii=False)
-                f.write(json_line + "\n")
+                write(to_json(page))
+                write(b"\n")
 
         logger.info("wrote_jsonl", path=str(output_path), pages=len(pages))
 
@@ -64,28 +75,54 @@ class Writer:
                 "Parquet support requires pyarrow. Install with: pip install yoink[parquet]"
             )
 
-        # Convert pages to dictionaries
-        data = [page.model_dump(mode="json") for page in pages]
-
-        # Flatten the data for better Parquet schema
-        flattened = []
-        for item in data:
-            flat = {
-                "url": item["url"],
-                "title": item.get("title"),
-                "text": item.get("text"),
-                "crawled_at": item["crawled_at"],
-                "status_code": item["status_code"],
-                "depth": item["depth"],
-                "num_links": len(item.get("links", [])),
-                # Store metadata as JSON string
-                "metadata": json.dumps(item.get("metadata", {})),
-            }
-            flattened.append(flat)
-
-        # Create Arrow table and write to Parquet
-        table = pa.Table.from_pylist(flattened)
-        pq.write_table(table, output_path, compression="snappy")
+        schema = pa.schema(
+            [
+                ("url", pa.string()),
+                ("title", pa.string()),
+                ("text", pa.string()),
+                ("crawled_at", pa.string()),
+                ("status_code", pa.int64()),
+                ("depth", pa.int64()),
+                ("num_links", pa.int64()),
+                ("metadata", pa.string()),
+            ]
+        )
+
+        # Each chunk of pages becomes one row group, so only one chunk's
+        # columns are held in Python lists and Arrow buffers at a time
+        with pq.ParquetWriter(output_path, schema, compression="snappy") as parquet_writer:
+            for start in range(0, len(pages), PARQUET_ROW_GROUP_SIZE):
+                chunk = pages[start : start + PARQUET_ROW_GROUP_SIZE]
+
+                # Build each column directly instead of a dict per row
+                urls, titles, texts, crawled_ats = [], [], [], []
+                status_codes, depths, num_links, metadata = [], [], [], []
+                for page in chunk:
+                    urls.append(page.url)
+                    titles.append(page.title)
+                    texts.append(page.text)
+                    crawled_ats.append(page.crawled_at.isoformat())
+                    status_codes.append(page.status_code)
+                    depths.append(page.depth)
+                    num_links.append(len(page.links))
+                    # Store metadata as JSON string
+                    metadata.append(serialization.dumps(page.metadata).decode("utf-8"))
+
+                parquet_writer.write_table(
+                    pa.Table.from_pydict(
+                        {
+                            "url": urls,
+                            "title": titles,
+                            "text": texts,
+                            "crawled_at": crawled_ats,
+                            "status_code": status_codes,
+                            "depth": depths,
+                            "num_links": num_links,
+                            "metadata": metadata,
+                        },
+                        schema=schema,
+                    )
+                )
 
         logger.info("wrote_parquet", path=str(output_path), pages=len(pages))
 
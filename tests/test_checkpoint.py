@@ -1,5 +1,6 @@
 """Tests for checkpoint functionality."""
 
+import asyncio
 import json
 import pytest
 from pathlib import Path
@@ -194,3 +195,311 @@ async def test_checkpoint_multiple_pages(temp_checkpoint_file):
         assert page.url == f"https://example.com/page{i}"
         assert page.title == f"Page {i}"
         assert page.depth == i
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_buffers_pages_until_interval(temp_checkpoint_file):
+    """Test that pages are held in memory until the flush interval is reached."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file), flush_interval=3)
+
+    for i in range(2):
+        await manager.write_page(Page(url=f"https://example.com/{i}", depth=0))
+
+    # Nothing handed to storage yet
+    assert not temp_checkpoint_file.exists()
+
+    await manager.write_page(Page(url="https://example.com/2", depth=0))
+
+    with open(temp_checkpoint_file, "r") as f:
+        assert len(f.readlines()) == 3
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_state_drains_pending_pages(temp_checkpoint_file):
+    """Test that buffered pages are written before a state record."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file), flush_interval=100)
+
+    await manager.write_page(Page(url="https://example.com/1", depth=0))
+    await manager.write_state(visited={"https://example.com/1"}, queue=[], filtered=set())
+    await manager.close()
+
+    with open(temp_checkpoint_file, "r") as f:
+        types = [json.loads(line)["type"] for line in f]
+
+    assert types == ["page", "state"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_load_metadata_and_state(temp_checkpoint_file, sample_page, sample_config):
+    """Test loading metadata and state without pages."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+
+    await manager.write_metadata("https://example.com", sample_config)
+    await manager.write_page(sample_page)
+    await manager.write_state(visited={"https://example.com"}, queue=[], filtered=set())
+    await manager.write_state(
+        visited={"https://example.com", "https://example.com/page1"}, queue=[], filtered=set()
+    )
+    await manager.close()
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load_metadata_and_state()
+
+    assert "pages" not in data
+    assert data["metadata"]["start_url"] == "https://example.com"
+    # Latest state wins
+    assert len(data["state"]["visited"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_iter_pages(temp_checkpoint_file, sample_config):
+    """Test streaming pages from checkpoint."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+
+    await manager.write_metadata("https://example.com", sample_config)
+    for i in range(3):
+        await manager.write_page(Page(url=f"https://example.com/{i}", depth=i))
+    await manager.close()
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    urls = [page.url async for page in manager2.iter_pages()]
+
+    assert urls == [f"https://example.com/{i}" for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_iter_pages_missing():
+    """Test streaming pages from a non-existent checkpoint yields nothing."""
+    manager = CheckpointManager.from_uri("nonexistent.jsonl")
+
+    assert [page async for page in manager.iter_pages()] == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_state_delta(temp_checkpoint_file):
+    """Test that repeated state writes only record new URLs and load folds them back."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file), full_state_interval=3)
+
+    visited = {"https://example.com/1"}
+    filtered: set[str] = set()
+    await manager.write_state(
+        visited, [("https://example.com/2", 1)], filtered, ["https://example.com/1"], []
+    )
+
+    visited.add("https://example.com/2")
+    filtered.add("https://example.com/skip")
+    await manager.write_state(
+        visited,
+        [("https://example.com/3", 1)],
+        filtered,
+        visited_added=["https://example.com/2"],
+        filtered_added=["https://example.com/skip"],
+    )
+    await manager.close()
+
+    with open(temp_checkpoint_file, "r") as f:
+        records = [json.loads(line) for line in f]
+
+    assert [r["type"] for r in records] == ["state", "state_delta"]
+    assert records[1]["visited_added"] == ["https://example.com/2"]
+    assert records[1]["filtered_added"] == ["https://example.com/skip"]
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load()
+
+    assert set(data["state"]["visited"]) == visited
+    assert set(data["state"]["filtered"]) == filtered
+    assert [tuple(item) for item in data["state"]["queue"]] == [("https://example.com/3", 1)]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_state_full_snapshot_interval(temp_checkpoint_file):
+    """Test that a full snapshot is written every full_state_interval writes."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file), full_state_interval=2)
+
+    visited: set[str] = set()
+    for i in range(3):
+        visited.add(f"https://example.com/{i}")
+        await manager.write_state(visited, [], set(), [f"https://example.com/{i}"], [])
+    await manager.close()
+
+    with open(temp_checkpoint_file, "r") as f:
+        types = [json.loads(line)["type"] for line in f]
+
+    assert types == ["state", "state_delta", "state"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_load_batched_preserves_order(temp_checkpoint_file, monkeypatch):
+    """Test that batched decoding keeps record order across batch boundaries."""
+    monkeypatch.setattr("yoink.checkpoint.LOAD_BATCH_SIZE", 2)
+
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    for i in range(7):
+        await manager.write_page(Page(url=f"https://example.com/{i}", depth=0))
+    await manager.close()
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load()
+
+    assert [page.url for page in data["pages"]] == [f"https://example.com/{i}" for i in range(7)]
+
+
+class _YieldingStorage(LocalFileStorage):
+    """Local storage whose writes suspend, exposing interleaving between writers."""
+
+    async def write(self, data):
+        await asyncio.sleep(0)
+        await super().write(data)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_concurrent_writers(temp_checkpoint_file):
+    """Test that concurrent write_page calls neither duplicate nor drop pages."""
+    manager = CheckpointManager(_YieldingStorage(str(temp_checkpoint_file)), flush_interval=3)
+
+    async def writer(worker_id):
+        for i in range(50):
+            await manager.write_page(Page(url=f"https://example.com/{worker_id}/{i}", depth=0))
+
+    await asyncio.gather(*(writer(w) for w in range(5)))
+    await manager.close()
+
+    with open(temp_checkpoint_file, "r") as f:
+        urls = [json.loads(line)["url"] for line in f]
+
+    assert len(urls) == 250
+    assert len(set(urls)) == 250
+
+
+class _CountingStorage(LocalFileStorage):
+    """Local storage that counts flushes."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.flushes = 0
+
+    async def flush(self):
+        self.flushes += 1
+        await super().flush()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_state_single_flush(temp_checkpoint_file):
+    """Test that buffered pages and a state record are persisted with one flush."""
+    storage = _CountingStorage(str(temp_checkpoint_file))
+    manager = CheckpointManager(storage, flush_interval=100)
+
+    await manager.write_page(Page(url="https://example.com/1", depth=0))
+    await manager.write_state(visited={"https://example.com/1"}, queue=[], filtered=set())
+
+    assert storage.flushes == 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_load_skips_whitespace_lines(temp_checkpoint_file, sample_page):
+    """Test that whitespace-only lines are ignored when loading."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    await manager.write_page(sample_page)
+    await manager.close()
+
+    with open(temp_checkpoint_file, "a") as f:
+        f.write("  \n\t\n")
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load()
+
+    assert len(data["pages"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_load_skips_non_object_records(temp_checkpoint_file, sample_page):
+    """Test that valid JSON lines which are not objects are skipped."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    await manager.write_page(sample_page)
+    await manager.close()
+
+    with open(temp_checkpoint_file, "a") as f:
+        f.write("[1, 2]\n42\n")
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load()
+
+    assert len(data["pages"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_state_without_deltas_is_full(temp_checkpoint_file):
+    """Test that write_state without added URLs always writes a full snapshot."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+
+    await manager.write_state({"https://example.com/1"}, [], set())
+    await manager.write_state({"https://example.com/1", "https://example.com/2"}, [], set())
+    await manager.close()
+
+    with open(temp_checkpoint_file, "r") as f:
+        types = [json.loads(line)["type"] for line in f]
+
+    assert types == ["state", "state"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_iter_pages_early_exit(temp_checkpoint_file, monkeypatch):
+    """Test that stopping iteration mid-checkpoint leaves no pending decode batch."""
+    monkeypatch.setattr("yoink.checkpoint.LOAD_BATCH_SIZE", 2)
+
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    for i in range(10):
+        await manager.write_page(Page(url=f"https://example.com/{i}", depth=0))
+    await manager.close()
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    pages = manager2.iter_pages()
+    first = await pages.__anext__()
+    await pages.aclose()
+
+    assert first.url == "https://example.com/0"
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_load_skips_corrupt_lines(temp_checkpoint_file):
+    """Test that a corrupt line only drops that record."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    await manager.write_page(Page(url="https://example.com/1", depth=0))
+    await manager.close()
+
+    with open(temp_checkpoint_file, "a") as f:
+        f.write('{"type": "page", "url": \n')
+
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    await manager.write_page(Page(url="https://example.com/2", depth=0))
+    await manager.close()
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load()
+
+    assert [page.url for page in data["pages"]] == [
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_load_without_pages(temp_checkpoint_file, sample_page, sample_config):
+    """Test that load(include_pages=False) returns metadata/state but no pages."""
+    manager = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    await manager.write_metadata("https://example.com", sample_config)
+    await manager.write_page(sample_page)
+    await manager.write_state(visited={"https://example.com"}, queue=[], filtered=set())
+    await manager.close()
+
+    manager2 = CheckpointManager.from_uri(str(temp_checkpoint_file))
+    data = await manager2.load(include_pages=False)
+
+    assert data["pages"] == []
+    assert data["metadata"]["start_url"] == "https://example.com"
+    assert data["state"]["visited"] == ["https://example.com"]
@@ -0,0 +1,64 @@
+"""Tests for the crawler engine."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from yoink.crawler import Crawler
+from yoink.models import CrawlConfig
+
+SITE = {
+    "/": '<title>Home</title><a href="/a">A</a><a href="/b">B</a>',
+    "/a": '<title>A</title><p>Page A text.</p><a href="/">Home</a><a href="/c">C</a>',
+    "/b": '<title>B</title><p>Page B text.</p>',
+    "/c": '<title>C</title><p>Page C text.</p>',
+}
+
+
+@pytest_asyncio.fixture
+async def site_url():
+    """Serve a small linked site from a local aiohttp server."""
+
+    async def page(request):
+        body = SITE.get(request.path)
+        if body is None:
+            raise web.HTTPNotFound()
+        return web.Response(text=f"<html><body>{body}</body></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+class TestCrawler:
+    """Test crawling a local site."""
+
+    @pytest.mark.parametrize("parse_processes", [0, 2])
+    async def test_crawl_site(self, site_url, parse_processes):
+        """Test every reachable page is crawled, in-loop or in a process pool."""
+        config = CrawlConfig(max_depth=2, max_concurrency=2, parse_processes=parse_processes)
+        crawler = Crawler(config=config)
+
+        pages = await crawler.crawl(f"{site_url}/")
+
+        assert sorted(page.title for page in pages) == ["A", "B", "C", "Home"]
+        home = next(page for page in pages if page.title == "Home")
+        assert home.links == [f"{site_url}/a", f"{site_url}/b"]
+        assert crawler._parse_pool is None
+
+    async def test_crawl_ends_when_no_page_succeeds(self, site_url):
+        """Test workers stop once the queue drains even if every fetch failed."""
+        config = CrawlConfig(max_concurrency=3, max_body_bytes=1)
+        crawler = Crawler(config=config)
+
+        pages = await asyncio.wait_for(crawler.crawl(f"{site_url}/"), timeout=5)
+
+        assert pages == []
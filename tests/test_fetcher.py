@@ -0,0 +1,70 @@
+"""Tests for HTTP fetcher."""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from yoink.fetcher import Fetcher
+
+
+@pytest_asyncio.fixture
+async def server_url():
+    """Serve small and oversized responses from a local aiohttp server."""
+
+    async def page(request):
+        return web.Response(text="<title>café</title>", content_type="text/html", charset="utf-8")
+
+    async def latin1(request):
+        return web.Response(
+            body="<title>café</title>".encode("latin-1"),
+            content_type="text/html",
+            charset="latin-1",
+        )
+
+    async def large(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(4):
+            await response.write(b"x" * 1024)
+        return response
+
+    async def sized(request):
+        return web.Response(body=b"x" * 4096)
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    app.router.add_get("/latin1", latin1)
+    app.router.add_get("/large", large)
+    app.router.add_get("/sized", sized)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+class TestFetcher:
+    """Test fetching and body handling."""
+
+    async def test_fetch_decodes_charset(self, server_url):
+        """Test body is decoded with the response charset."""
+        async with Fetcher() as fetcher:
+            content, status = await fetcher.fetch(f"{server_url}/page")
+            latin1_content, _ = await fetcher.fetch(f"{server_url}/latin1")
+
+        assert status == 200
+        assert content == "<title>café</title>"
+        assert latin1_content == "<title>café</title>"
+
+    async def test_fetch_rejects_large_body(self, server_url):
+        """Test bodies over max_body_bytes are rejected, with or without Content-Length."""
+        async with Fetcher(max_body_bytes=2048) as fetcher:
+            with pytest.raises(ValueError):
+                await fetcher.fetch(f"{server_url}/large")
+            with pytest.raises(ValueError):
+                await fetcher.fetch(f"{server_url}/sized")
+
+            content, _ = await fetcher.fetch(f"{server_url}/page")
+            assert content == "<title>café</title>"
@@ -111,6 +111,63 @@ class TestURLFilter:
         assert filter.should_crawl("https://docs.python.org")
         assert not filter.should_crawl("https://example.com/java-tutorial")
 
+    def test_skip_extensions_path_only(self):
+        """Test that extensions are only matched at the end of the URL path."""
+        filter = URLFilter(skip_extensions=["pdf", "zip"])
+
+        assert not filter.should_crawl("https://example.com/file.pdf?download=1")
+        assert not filter.should_crawl("https://example.com/file.pdf#page=2")
+        assert filter.should_crawl("https://files.zip/")
+        assert filter.should_crawl("https://example.com/view?file=report.pdf")
+        assert filter.should_crawl("https://example.com/file.pdf/preview")
+
+    def test_mixed_patterns(self):
+        """Test glob, regex and substring patterns combined in one filter."""
+        filter = URLFilter(
+            include_patterns=["*/blog/*", r"^https://docs\.example\.com/\d+$", "python"],
+        )
+
+        assert filter.should_crawl("https://example.com/blog/post")
+        assert filter.should_crawl("https://docs.example.com/42")
+        assert filter.should_crawl("https://example.com/learn-python")
+        assert not filter.should_crawl("https://docs.example.com/intro")
+
+    def test_regex_backreference(self):
+        """Test regexes with groups keep their backreferences."""
+        filter = URLFilter(include_patterns=["docs", r"^https://(\w)\1\.com/"])
+
+        assert filter.should_crawl("https://aa.com/page")
+        assert not filter.should_crawl("https://ab.com/page")
+
+    def test_invalid_regex_ignored(self):
+        """Test that an invalid regex pattern never matches."""
+        filter = URLFilter(exclude_patterns=["[unclosed$"])
+
+        assert filter.should_crawl("https://example.com/[unclosed")
+
+    def test_required_literals(self):
+        """Test the literal pre-check agrees with full pattern matching."""
+        filter = URLFilter(
+            include_patterns=["*/blog/*", "https://example.com/docs?"],
+            exclude_patterns=["draft", "*.com/blog/tmp-*"],
+        )
+
+        assert filter._include_literals == ("/blog/", "https://example.com/docs")
+        assert filter._exclude_literals == ("draft", ".com/blog/tmp-")
+        assert filter.should_crawl("https://example.com/blog/post")
+        assert filter.should_crawl("https://example.com/docs2")
+        assert not filter.should_crawl("https://example.com/docs")
+        assert not filter.should_crawl("https://example.com/about")
+        assert not filter.should_crawl("https://example.com/blog/draft-1")
+        assert not filter.should_crawl("https://example.com/blog/tmp-1")
+
+    def test_required_literals_unavailable(self):
+        """Test patterns without a literal disable the pre-check."""
+        assert URLFilter(include_patterns=["*"])._include_literals is None
+        assert URLFilter(include_patterns=["*/[ab]/*"])._include_literals is None
+        assert URLFilter(include_patterns=["blog", r"^https://"])._include_literals is None
+        assert URLFilter(include_patterns=["blog", "*"]).should_crawl("https://example.com/")
+
     def test_get_stats(self):
         """Test filter statistics."""
         filter = URLFilter(
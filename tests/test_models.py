@@ -1,7 +1,7 @@
 """Tests for data models."""
 
 import pytest
-from yoink.models import Page, CrawlConfig
+from yoink.models import Page, CrawlConfig, ConnectionConfig
 
 
 class TestPage:
@@ -80,3 +80,24 @@ class TestCrawlConfig:
         # Invalid config (negative depth) should raise
         with pytest.raises(Exception):
             CrawlConfig(max_depth=-1)
+
+    def test_connection_defaults(self):
+        """Test CrawlConfig carries default connection pool settings."""
+        config = CrawlConfig()
+
+        assert config.connection.pool_limit == 0
+        assert config.connection.pool_limit_per_host == 30
+        assert config.connection.dns_cache_ttl == 300
+        assert config.connection.keepalive_timeout == 30
+
+    def test_connection_from_dict(self):
+        """Test nested connection settings round-trip through model_dump."""
+        config = CrawlConfig(connection={"pool_limit": 50, "pool_limit_per_host": 5})
+
+        assert isinstance(config.connection, ConnectionConfig)
+        assert config.connection.pool_limit == 50
+        restored = CrawlConfig(**config.model_dump())
+        assert restored.connection == config.connection
+
+        with pytest.raises(Exception):
+            ConnectionConfig(pool_limit=-1)
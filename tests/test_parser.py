@@ -55,3 +55,49 @@ class TestParser:
         assert result["title"] is None
         assert result["links"] == []
         assert result["metadata"] == {}
+
+    def test_parse_links_normalization(self, sample_url):
+        """Test fragments are stripped and non-http(s) links dropped."""
+        parser = Parser()
+        html = """
+        <a href="/page1#intro">Intro</a>
+        <a href="/page1#details">Details</a>
+        <a href="mailto:someone@example.com">Mail</a>
+        <a href="javascript:void(0)">Script</a>
+        <a href="ftp://files.example.com/pub">FTP</a>
+        <a href="HTTP://Other.com/Page#top">Upper</a>
+        <a>No href</a>
+        """
+        result = parser.parse(html, sample_url)
+
+        assert result["links"] == ["https://example.com/page1", "HTTP://Other.com/Page"]
+
+    def test_parse_metadata_filters(self, sample_url):
+        """Test only OpenGraph and whitelisted named meta tags are kept."""
+        parser = Parser()
+        html = """
+        <head>
+            <title>  Spaced &amp; Escaped  </title>
+            <meta property="og:image" content="https://example.com/a.png">
+            <meta property="og:empty" content="">
+            <meta property="twitter:card" content="summary">
+            <meta name="author" content="Jane">
+            <meta name="viewport" content="width=device-width">
+        </head>
+        """
+        result = parser.parse(html, sample_url)
+
+        assert result["title"] == "Spaced & Escaped"
+        assert result["metadata"] == {
+            "og:image": "https://example.com/a.png",
+            "author": "Jane",
+        }
+
+    def test_links_shared_across_pages(self, sample_html, sample_url):
+        """Test the same link found on two pages is one string object."""
+        parser = Parser()
+        first = parser.parse(sample_html, sample_url)["links"]
+        second = parser.parse(sample_html, sample_url + "/other")["links"]
+
+        assert first[0] == second[0]
+        assert first[0] is second[0]
@@ -1,5 +1,8 @@
 """Tests for URL scheduler."""
 
+import asyncio
+from collections import deque
+
 import pytest
 from yoink.scheduler import Scheduler
 
@@ -53,6 +56,26 @@ class TestScheduler:
         size = await scheduler.size()
         assert size == 2  # External URL rejected
 
+    async def test_filtered_url_checked_once(self):
+        """Test a rejected URL isn't run through the filters again."""
+
+        class CountingFilter:
+            calls = 0
+
+            def should_crawl(self, url):
+                self.calls += 1
+                return not url.endswith("/login")
+
+        url_filter = CountingFilter()
+        scheduler = Scheduler(url_filter=url_filter)
+
+        await scheduler.add("https://example.com", depth=0)
+        await scheduler.add_many(["https://example.com/login"] * 3, depth=1)
+
+        assert url_filter.calls == 2
+        assert await scheduler.filtered_count() == 1
+        assert await scheduler.size() == 1
+
     async def test_follow_external(self):
         """Test following external links when enabled."""
         scheduler = Scheduler(follow_external=True)
@@ -63,6 +86,54 @@ class TestScheduler:
         size = await scheduler.size()
         assert size == 2  # External URL accepted
 
+    async def test_add_many(self):
+        """Test batch adds apply the same dedupe, depth and domain rules."""
+        scheduler = Scheduler(max_depth=1)
+
+        await scheduler.add("https://example.com", depth=0)
+        await scheduler.add_many(
+            [
+                "https://example.com/a",
+                "https://example.com/a",
+                "https://external.com/b",
+                "https://example.com",
+                "https://example.com/c",
+            ],
+            depth=1,
+        )
+        await scheduler.add_many(["https://example.com/too-deep"], depth=2)
+
+        assert scheduler.queue == deque(
+            [
+                ("https://example.com", 0),
+                ("https://example.com/a", 1),
+                ("https://example.com/c", 1),
+            ]
+        )
+
+    async def test_next_url_waits_for_in_progress(self):
+        """Test next_url waits while URLs are in progress and ends when all are done."""
+        scheduler = Scheduler()
+        await scheduler.add("https://example.com", depth=0)
+
+        assert await scheduler.next_url() == ("https://example.com", 0)
+
+        # Queue is empty but the start page is still in progress
+        waiter = asyncio.create_task(scheduler.next_url())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await scheduler.add_many(["https://example.com/a"], depth=1)
+        scheduler.task_done()
+        assert await waiter == ("https://example.com/a", 1)
+
+        finished = asyncio.create_task(scheduler.next_url())
+        await asyncio.sleep(0)
+        assert not finished.done()
+
+        scheduler.task_done()
+        assert await finished is None
+
     async def test_empty_queue(self):
         """Test getting from empty queue."""
         scheduler = Scheduler()
@@ -70,3 +141,46 @@ class TestScheduler:
 
         assert result is None
         assert scheduler.is_empty()
+
+    async def test_take_changes(self):
+        """Test journaling of newly visited and filtered URLs."""
+        from yoink.filters import CombinedFilter
+
+        url_filter = CombinedFilter.from_config(exclude_patterns=["*/private/*"])
+        scheduler = Scheduler(url_filter=url_filter, track_changes=True)
+
+        await scheduler.add("https://example.com", depth=0)
+        await scheduler.add("https://example.com/private/x", depth=1)
+
+        assert scheduler.take_changes() == (
+            ["https://example.com"],
+            ["https://example.com/private/x"],
+        )
+
+        await scheduler.add("https://example.com/page", depth=1)
+        assert scheduler.take_changes() == (["https://example.com/page"], [])
+
+    async def test_take_changes_disabled(self):
+        """Test that nothing is journaled unless track_changes is set."""
+        scheduler = Scheduler()
+
+        await scheduler.add("https://example.com", depth=0)
+        assert scheduler.take_changes() == ([], [])
+
+    async def test_restore(self):
+        """Test restoring saved state keeps order and isn't reported as new."""
+        scheduler = Scheduler(track_changes=True)
+
+        scheduler.restore(
+            visited=["https://example.com", "https://example.com/a"],
+            filtered=["https://example.com/private"],
+            queue=[["https://example.com/b", 1]],
+        )
+
+        assert scheduler.start_domain == "example.com"
+        assert scheduler.visited_list == ["https://example.com", "https://example.com/a"]
+        assert await scheduler.get() == ("https://example.com/b", 1)
+        assert scheduler.take_changes() == ([], [])
+
+        await scheduler.add("https://example.com/c", depth=1)
+        assert scheduler.take_changes() == (["https://example.com/c"], [])
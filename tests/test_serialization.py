@@ -0,0 +1,62 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from yoink import serialization
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("backend")
+class TestSerialization:
+    """Test dumps/loads round-tripping."""
+
+    def test_dumps_returns_compact_bytes(self):
+        """Test default output is compact UTF-8 bytes."""
+        data = serialization.dumps({"a": 1, "b": [1, 2]})
+
+        assert isinstance(data, bytes)
+        assert data == b'{"a":1,"b":[1,2]}'
+
+    def test_dumps_indent(self):
+        """Test pretty-printed output parses back to same object."""
+        obj = {"a": 1, "nested": {"b": "c"}}
+        data = serialization.dumps(obj, indent=True)
+
+        assert b"\n" in data
+        assert json.loads(data) == obj
+
+    def test_dumps_non_str_keys(self):
+        """Test integer dict keys are serialized like the stdlib does."""
+        data = serialization.dumps({0: 1, 200: 2})
+
+        assert json.loads(data) == {"0": 1, "200": 2}
+
+    def test_dumps_unicode(self):
+        """Test non-ASCII text is written as UTF-8, not escaped."""
+        data = serialization.dumps({"title": "café"})
+
+        assert "café".encode("utf-8") in data
+
+    def test_dumps_datetime(self):
+        """Test datetimes serialize to ISO-8601 strings."""
+        data = serialization.dumps({"at": datetime(2024, 1, 2, 3, 4, 5)})
+
+        assert json.loads(data)["at"].startswith("2024-01-02")
+
+    def test_loads_str_and_bytes(self):
+        """Test loading from both str and bytes."""
+        assert serialization.loads('{"a": 1}\n') == {"a": 1}
+        assert serialization.loads(b'{"a": 1}') == {"a": 1}
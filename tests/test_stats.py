@@ -111,6 +111,35 @@ class TestCrawlStats:
         assert result["total_pages"] == 3
         assert result["total_links"] == 3
 
+    def test_from_jsonl_file_round_trip(self, sample_pages, tmp_path):
+        """Test JSONL pages load back equal to the originals, skipping blank lines."""
+        jsonl_file = tmp_path / "test.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            for page in sample_pages:
+                f.write(page.model_dump_json() + "\n\n")
+
+        stats = CrawlStats.from_file(jsonl_file)
+
+        assert stats.pages == sample_pages
+
+    def test_from_file_streaming(self, sample_pages, tmp_path):
+        """Test streamed stats match stats computed from a loaded list."""
+        jsonl_file = tmp_path / "test.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            for page in sample_pages:
+                f.write(page.model_dump_json() + "\n")
+
+        stats = CrawlStats.from_file_streaming(jsonl_file)
+
+        assert not isinstance(stats.pages, list)
+        assert stats.compute() == CrawlStats(sample_pages).compute()
+        assert stats.compute()["total_pages"] == 3  # Cached after one pass
+
+    def test_from_file_streaming_unsupported(self, tmp_path):
+        """Test unsupported formats fail when streaming stats are created."""
+        with pytest.raises(ValueError):
+            CrawlStats.from_file_streaming(tmp_path / "pages.csv")
+
     def test_from_json_file(self, sample_pages, tmp_path):
         """Test loading from JSON file."""
         # Create test JSON file
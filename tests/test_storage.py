@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 
+from yoink import storage as storage_module
 from yoink.storage import LocalFileStorage, S3Storage, StorageFactory
 
 
@@ -18,9 +19,9 @@ async def test_local_storage_write_and_read(temp_file):
     storage = LocalFileStorage(str(temp_file))
 
     # Write data
-    await storage.write("Line 1\n")
-    await storage.write("Line 2\n")
-    await storage.write("Line 3\n")
+    await storage.write(b"Line 1\n")
+    await storage.write(b"Line 2\n")
+    await storage.write(b"Line 3\n")
     await storage.flush()
     await storage.close()
 
@@ -43,7 +44,7 @@ async def test_local_storage_exists(temp_file):
     assert not await storage.exists()
 
     # Write something
-    await storage.write("test\n")
+    await storage.write(b"test\n")
     await storage.close()
 
     # Should exist now
@@ -57,12 +58,12 @@ async def test_local_storage_append(temp_file):
     """Test appending to existing file."""
     # First write
     storage1 = LocalFileStorage(str(temp_file))
-    await storage1.write("Line 1\n")
+    await storage1.write(b"Line 1\n")
     await storage1.close()
 
     # Append more
     storage2 = LocalFileStorage(str(temp_file))
-    await storage2.write("Line 2\n")
+    await storage2.write(b"Line 2\n")
     await storage2.close()
 
     # Read all
@@ -85,7 +86,7 @@ async def test_local_storage_flush():
 
     try:
         storage = LocalFileStorage(temp_path)
-        await storage.write("test data\n")
+        await storage.write(b"test data\n")
         await storage.flush()
 
         # Data should be flushed to disk
@@ -137,10 +138,220 @@ async def test_local_storage_context_manager(temp_file):
     """Test using local storage as context manager."""
     storage = LocalFileStorage(str(temp_file))
 
-    await storage.write("test\n")
+    await storage.write(b"test\n")
     await storage.close()
 
     # Verify file was written
     assert temp_file.exists()
     with open(temp_file, "r") as f:
         assert f.read() == "test\n"
+
+
+class _FakeBody:
+    """Minimal stand-in for an aiobotocore streaming body."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self) -> bytes:
+        return self._data
+
+    async def iter_chunks(self, chunk_size: int = 1024):
+        # Tiny chunks so lines and gzip members straddle chunk boundaries
+        for start in range(0, len(self._data), 3):
+            yield self._data[start : start + 3]
+
+
+class _FakeS3Client:
+    """In-memory S3 client supporting the calls S3Storage makes."""
+
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+    def __init__(self):
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.calls: list[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise self.exceptions.NoSuchKey()
+        return {"ContentLength": len(self.objects[(Bucket, Key)])}
+
+    async def get_object(self, Bucket, Key):
+        self.calls.append("get_object")
+        return {"Body": _FakeBody(self.objects[(Bucket, Key)])}
+
+    async def put_object(self, Bucket, Key, Body):
+        self.calls.append("put_object")
+        self.objects[(Bucket, Key)] = bytes(Body)
+
+    async def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    async def upload_part_copy(self, Bucket, Key, UploadId, PartNumber, CopySource, CopySourceRange):
+        self.calls.append("upload_part_copy")
+        start, end = map(int, CopySourceRange.removeprefix("bytes=").split("-"))
+        source = self.objects[(CopySource["Bucket"], CopySource["Key"])]
+        self.uploads[UploadId][PartNumber] = source[start : end + 1]
+        return {"CopyPartResult": {"ETag": f"copy-{PartNumber}"}}
+
+    async def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.calls.append("upload_part")
+        self.uploads[UploadId][PartNumber] = bytes(Body)
+        return {"ETag": f"part-{PartNumber}"}
+
+    async def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        self.objects[(Bucket, Key)] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """Route every S3Storage to a shared in-memory client."""
+    client = _FakeS3Client()
+
+    async def get_client(self):
+        return client
+
+    monkeypatch.setattr(S3Storage, "_get_client", get_client)
+    return client
+
+
+def test_s3_storage_compress_from_suffix():
+    """Test gzip compression is enabled for .gz keys."""
+    assert S3Storage("s3://bucket/checkpoint.jsonl.gz").compress
+    assert not S3Storage("s3://bucket/checkpoint.jsonl").compress
+    assert S3Storage("s3://bucket/checkpoint.jsonl", compress=True).compress
+
+
+@pytest.mark.asyncio
+async def test_s3_storage_write_and_read(fake_s3):
+    """Test flushing to and reading back from S3."""
+    storage = S3Storage("s3://bucket/checkpoint.jsonl")
+    await storage.write(b"Line 1\n")
+    await storage.flush()
+    await storage.write(b"Line 2\n")
+    await storage.close()
+
+    assert fake_s3.objects[("bucket", "checkpoint.jsonl")] == b"Line 1\nLine 2\n"
+
+    lines = [line async for line in S3Storage("s3://bucket/checkpoint.jsonl").read()]
+    assert lines == ["Line 1\n", "Line 2\n"]
+
+
+@pytest.mark.asyncio
+async def test_s3_storage_gzip_roundtrip(fake_s3):
+    """Test gzip-compressed S3 checkpoints append members and read back as text."""
+    import gzip
+
+    storage = S3Storage("s3://bucket/checkpoint.jsonl.gz")
+    await storage.write(b"Line 1\n")
+    await storage.flush()
+    await storage.write(b"Line 2\n")
+    await storage.close()
+
+    raw = fake_s3.objects[("bucket", "checkpoint.jsonl.gz")]
+    assert gzip.decompress(raw) == b"Line 1\nLine 2\n"
+
+    lines = [line async for line in S3Storage("s3://bucket/checkpoint.jsonl.gz").read()]
+    assert lines == ["Line 1\n", "Line 2\n"]
+
+
+@pytest.mark.asyncio
+async def test_s3_storage_read_streams_chunks(fake_s3):
+    """Test lines, multi-byte characters and gzip members spanning chunks."""
+    import gzip
+
+    fake_s3.objects[("bucket", "plain.jsonl")] = "caf\u00e9 1\nLine 2\nno newline".encode()
+    fake_s3.objects[("bucket", "packed.jsonl.gz")] = (
+        gzip.compress("caf\u00e9 1\n".encode()) + gzip.compress(b"Line 2\nLine 3\n")
+    )
+
+    lines = [line async for line in S3Storage("s3://bucket/plain.jsonl").read()]
+    assert lines == ["caf\u00e9 1\n", "Line 2\n", "no newline"]
+
+    lines = [line async for line in S3Storage("s3://bucket/packed.jsonl.gz").read()]
+    assert lines == ["caf\u00e9 1\n", "Line 2\n", "Line 3\n"]
+
+
+@pytest.mark.asyncio
+async def test_s3_storage_multipart_append(fake_s3, monkeypatch):
+    """Test flushes onto a large object append via server-side part copy."""
+    monkeypatch.setattr(storage_module, "S3_MIN_PART_SIZE", 10)
+    monkeypatch.setattr(storage_module, "S3_MAX_COPY_PART_SIZE", 16)
+
+    storage = S3Storage("s3://bucket/checkpoint.jsonl")
+    await storage.write(b"0123456789abcdefghij\n")
+    await storage.flush()
+    await storage.write(b"Line 2\n")
+    await storage.flush()
+    await storage.write(b"Line 3\n")
+    await storage.close()
+
+    assert fake_s3.objects[("bucket", "checkpoint.jsonl")] == (
+        b"0123456789abcdefghij\nLine 2\nLine 3\n"
+    )
+    # First flush creates the object; later ones never download it
+    assert fake_s3.calls.count("get_object") == 0
+    assert fake_s3.calls.count("upload_part") == 2
+    assert not fake_s3.uploads
+
+
+@pytest.mark.asyncio
+async def test_s3_storage_reuses_client(monkeypatch):
+    """Test the S3 client is entered once and exited on close."""
+    import sys
+    import types
+
+    client = _FakeS3Client()
+    entered = []
+    exited = []
+
+    class _ClientContext:
+        async def __aenter__(self):
+            entered.append(True)
+            return client
+
+        async def __aexit__(self, *exc):
+            exited.append(True)
+            return False
+
+    class _Session:
+        def client(self, service_name):
+            return _ClientContext()
+
+    monkeypatch.setitem(sys.modules, "aioboto3", types.SimpleNamespace(Session=_Session))
+
+    storage = S3Storage("s3://bucket/checkpoint.jsonl")
+    await storage.write(b"Line 1\n")
+    await storage.flush()
+    assert await storage.exists()
+    lines = [line async for line in storage.read()]
+    await storage.write(b"Line 2\n")
+    await storage.close()
+
+    assert lines == ["Line 1\n"]
+    assert len(entered) == 1
+    assert len(exited) == 1
+    assert client.objects[("bucket", "checkpoint.jsonl")] == b"Line 1\nLine 2\n"
@@ -0,0 +1,98 @@
+"""Tests for output writers."""
+
+import json
+from datetime import datetime
+
+import pytest
+from yoink import writers
+from yoink.models import Page
+from yoink.writers import Writer
+
+
+@pytest.fixture
+def sample_pages():
+    """Pages with unicode, empty and non-default fields."""
+    return [
+        Page(
+            url="https://example.com/1",
+            title="Tïtle",
+            text="Hello wörld",
+            links=["https://example.com/2", "https://example.com/3"],
+            metadata={"og:title": "Ünï"},
+            crawled_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+            depth=1,
+        ),
+        Page(
+            url="https://example.com/2",
+            crawled_at=datetime(2024, 1, 2),
+            status_code=404,
+        ),
+    ]
+
+
+def test_write_parquet(sample_pages, tmp_path):
+    """Test Parquet output has one flattened row per page."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "pages.parquet"
+
+    Writer.write_parquet(sample_pages, output)
+
+    rows = pq.read_table(output).to_pylist()
+    assert rows[0]["url"] == "https://example.com/1"
+    assert rows[0]["title"] == "Tïtle"
+    assert rows[0]["crawled_at"] == "2024-01-02T03:04:05.000678"
+    assert rows[0]["num_links"] == 2
+    assert json.loads(rows[0]["metadata"]) == {"og:title": "Ünï"}
+    assert rows[1]["title"] is None
+    assert rows[1]["status_code"] == 404
+    assert json.loads(rows[1]["metadata"]) == {}
+
+
+def test_write_parquet_row_groups(sample_pages, tmp_path, monkeypatch):
+    """Test pages are written in row groups of PARQUET_ROW_GROUP_SIZE."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(writers, "PARQUET_ROW_GROUP_SIZE", 1)
+    output = tmp_path / "pages.parquet"
+
+    Writer.write_parquet(sample_pages * 2, output)
+
+    assert pq.ParquetFile(output).num_row_groups == 4
+    assert [row["url"] for row in pq.read_table(output).to_pylist()] == [
+        page.url for page in sample_pages * 2
+    ]
+
+
+def test_write_parquet_empty(tmp_path):
+    """Test an empty crawl still writes the full schema."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "pages.parquet"
+
+    Writer.write_parquet([], output)
+
+    table = pq.read_table(output)
+    assert table.num_rows == 0
+    assert "num_links" in table.schema.names
+
+
+def test_write_jsonl(sample_pages, tmp_path):
+    """Test JSONL output has one page per line that loads back unchanged."""
+    output = tmp_path / "pages.jsonl"
+
+    Writer.write_jsonl(sample_pages, output)
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert [Page.model_validate_json(line) for line in lines] == sample_pages
+    assert json.loads(lines[0])["crawled_at"] == "2024-01-02T03:04:05.000678"
+
+
+def test_write_json(sample_pages, tmp_path):
+    """Test JSON output matches json.dump of the pages' JSON-mode dumps."""
+    output = tmp_path / "pages.json"
+
+    Writer.write_json(sample_pages, output)
+
+    expected = json.dumps(
+        [page.model_dump(mode="json") for page in sample_pages], indent=2, ensure_ascii=False
+    )
+    assert output.read_text(encoding="utf-8") == expected